@@ -3,6 +3,8 @@ from entities.Directions import Directions
 from entities.Role import Role
 
 class Car:
+    __slots__ = ("x", "y", "speed", "direction", "role")
+
     def __init__(self, x=0.0, y=0.0, speed=0.0, direction=Directions.FORWARD, role=Role.CIVILIAN):
         self.x = x
         self.y = y
@@ -6,6 +6,8 @@ Modules
 -------
 world
     :class:`World` entity manager and physics loop.
+car_arrays
+    :class:`CarArrays` struct-of-arrays mirror used by vectorised ticks.
 traffic_policy
     :class:`SafetyPolicy` tunable constants and scoring helpers.
 sim_bridge
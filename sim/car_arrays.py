@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+sim/car_arrays.py
+=================
+Struct-of-arrays mirror of the :class:`~sim.world.Car` entities.
+
+:class:`~sim.world.World` keeps its public ``cars`` list of objects, but
+the per-tick hot paths (movement, pass detection, pair-wise guards) work
+on parallel NumPy arrays so one C-level loop replaces *N* Python
+dispatches.  :meth:`CarArrays.load` refreshes the mirror from the car
+objects; callers write results back explicitly.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Sequence, Tuple
+
+import numpy as np
+
+from sim.physics import KMH_TO_MPS
+from sim.traffic_policy import SafetyPolicy, danger_score_array, role_weight
+
+#: Approach arms in index order (``approach_idx``).
+APPROACHES: Tuple[str, ...] = ("W", "N", "E", "S")
+
+#: Vehicle roles in index order (``role_idx``); ``-1`` marks unknown roles.
+ROLES: Tuple[str, ...] = ("civilian", "bus", "taxi", "police", "ambulance", "fire")
+
+_APPROACH_INDEX: Dict[str, int] = {a: i for i, a in enumerate(APPROACHES)}
+_ROLE_INDEX: Dict[str, int] = {r: i for i, r in enumerate(ROLES)}
+
+# Role bonus per ``role_idx``; the trailing 0.0 serves ``role_idx == -1``.
+_ROLE_BONUS = np.array([role_weight(r) for r in ROLES] + [0.0])
+_EMERGENCY_ROLE_IDX = np.array(
+    [ROLES.index(r) for r in ("ambulance", "police", "fire")], dtype=np.int8,
+)
+
+
+class CarArrays:
+    """Parallel per-car arrays, index-aligned with ``World.cars``.
+
+    Attributes
+    ----------
+    n : int
+        Number of cars mirrored.
+    x, y, vx, vy : numpy.ndarray
+        Position (m) and unit velocity, ``float64``.
+    speed, cruise_speed, speed_limit, wait_s : numpy.ndarray
+        Longitudinal state, ``float64``.
+    cx, cy : numpy.ndarray
+        Centre of each car's current intersection.
+    passed, stopped, turning, priority : numpy.ndarray
+        Boolean flags.
+    approach_idx, role_idx : numpy.ndarray
+        Indices into :data:`APPROACHES` / :data:`ROLES` (``int8``).
+    """
+
+    __slots__ = (
+        "n", "x", "y", "vx", "vy", "speed", "cruise_speed", "speed_limit",
+        "wait_s", "cx", "cy", "passed", "stopped", "turning", "priority",
+        "approach_idx", "role_idx",
+    )
+
+    def __init__(self) -> None:
+        self.load((), {})
+
+    def load(
+        self,
+        cars: Sequence[Any],
+        centers: Dict[str, Tuple[float, float]],
+    ) -> None:
+        """Refresh every array from *cars*.
+
+        *centers* maps intersection id → ``(cx, cy)``; unknown ids fall
+        back to the origin, matching ``World._int_center``.
+        """
+        n = len(cars)
+        self.n = n
+        origin = (0.0, 0.0)
+        floats = [
+            (c.x, c.y, c.vx, c.vy, c.speed, c.cruise_speed, c.speed_limit_kmh,
+             c.wait_s, *centers.get(c.current_int_id, origin))
+            for c in cars
+        ]
+        (self.x, self.y, self.vx, self.vy, self.speed, self.cruise_speed,
+         self.speed_limit, self.wait_s, self.cx, self.cy) = (
+            np.array(floats, dtype=np.float64).reshape(n, 10).T.copy()
+        )
+        flags = [(c.passed, c.stopped, c.is_turning, bool(c.priority)) for c in cars]
+        self.passed, self.stopped, self.turning, self.priority = (
+            np.array(flags, dtype=np.bool_).reshape(n, 4).T.copy()
+        )
+        codes = [
+            (_APPROACH_INDEX.get(c.approach, -1),
+             _ROLE_INDEX.get(str(c.role).lower(), -1))
+            for c in cars
+        ]
+        self.approach_idx, self.role_idx = (
+            np.array(codes, dtype=np.int8).reshape(n, 2).T.copy()
+        )
+
+    # ── vectorised kinematics ─────────────────────────────────────────────
+
+    def advance_straight(self, dt: float) -> np.ndarray:
+        """Move every non-stopped, non-turning car along ``(vx, vy)``.
+
+        Returns the boolean mask of cars that were advanced so the caller
+        can write their positions back.
+        """
+        mask = ~(self.stopped | self.turning)
+        step = self.speed[mask] * KMH_TO_MPS
+        self.x[mask] += self.vx[mask] * step * dt
+        self.y[mask] += self.vy[mask] * step * dt
+        return mask
+
+    def apply_speed_targets(
+        self,
+        target: np.ndarray,
+        dt: float,
+        policy: SafetyPolicy,
+    ) -> None:
+        """Ramp ``speed`` toward *target* (km/h) and update ``wait_s``.
+
+        Braking is limited to ``max_brake_kmh_s``; acceleration to
+        ``max_accel_kmh_s``, or ``green_launch_accel_kmh_s`` when
+        launching from near-standstill toward a high target.  Speeds
+        below the creep filter snap to zero when the target is also that
+        low.
+        """
+        target = np.maximum(0.0, target)
+        speed = self.speed
+        creep = policy.creep_filter_kmh
+        accel = np.where(
+            (target >= self.cruise_speed * 0.8) & (speed < creep * 2),
+            policy.green_launch_accel_kmh_s,
+            policy.max_accel_kmh_s,
+        )
+        speed = np.where(
+            speed > target,
+            np.maximum(target, speed - policy.max_brake_kmh_s * dt),
+            np.where(speed < target, np.minimum(target, speed + accel * dt), speed),
+        )
+        speed[(speed < creep) & (target < creep)] = 0.0
+        self.speed = speed
+        self.wait_s = np.where(
+            speed < 1.0, self.wait_s + dt, np.maximum(0.0, self.wait_s - 0.25 * dt),
+        )
+
+    def distance_to_line(self, edge: float) -> np.ndarray:
+        """Vectorised ``World._distance_to_stop_line`` for a line at *edge*."""
+        rx = self.x - self.cx
+        ry = self.y - self.cy
+        vx, vy = self.vx, self.vy
+        return np.where(vx > 0, -rx - edge,
+               np.where(vx < 0, rx - edge,
+               np.where(vy < 0, ry - edge,
+               np.where(vy > 0, -ry - edge, np.hypot(rx, ry)))))
+
+    # ── scheduling ────────────────────────────────────────────────────────
+
+    def emergency(self) -> np.ndarray:
+        """Mask of priority flags or emergency roles (``World._is_emergency``)."""
+        return self.priority | np.isin(self.role_idx, _EMERGENCY_ROLE_IDX)
+
+    def danger_scores(self, policy: SafetyPolicy) -> np.ndarray:
+        """Vectorised :func:`~sim.traffic_policy.danger_score` per car."""
+        return danger_score_array(
+            self.speed, self.speed_limit, self.wait_s,
+            _ROLE_BONUS[self.role_idx], policy,
+        )
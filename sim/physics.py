@@ -12,10 +12,13 @@ from __future__ import annotations
 
 import math
 
+#: km/h → m/s factor; multiply rather than divide by 3.6 on hot paths.
+KMH_TO_MPS: float = 1.0 / 3.6
+
 
 def kmh_to_mps(speed_kmh: float) -> float:
     """Convert km/h to m/s, clamping negatives to zero."""
-    return max(0.0, float(speed_kmh)) / 3.6
+    return max(0.0, float(speed_kmh)) * KMH_TO_MPS
 
 
 def mps_to_kmh(speed_mps: float) -> float:
@@ -39,7 +42,7 @@ def braking_distance(speed_kmh: float, decel_kmh_s: float) -> float:
         Distance in metres needed to reach zero speed.
     """
     v = kmh_to_mps(speed_kmh)
-    a = max(0.1, decel_kmh_s / 3.6)  # m/s²
+    a = max(0.1, decel_kmh_s * KMH_TO_MPS)  # m/s²
     return (v * v) / (2.0 * a)
 
 
@@ -376,14 +376,20 @@ class SimBridge:
 
     # ── tick ──────────────────────────────────────────────────────────────────
 
-    def _infer_for_car(self, ego_car: Car, others: Sequence[Car]) -> Dict[str, Any]:
+    def _infer_for_car(
+        self,
+        ego_car: Car,
+        snapshot: Sequence[Dict[str, Any]],
+        index: int,
+    ) -> Dict[str, Any]:
         """
         Run ML inference for one standalone vehicle entity.
         """
         raw = fa_inferenta_din_json(
             ego_car.ml_payload(
                 self._world.sign_for_car(ego_car),
-                others,
+                snapshot,
+                index,
                 traffic_light=self._world.semaphore_color_for_car(ego_car),
             ),
             model_path=self._model_path,
@@ -462,27 +468,27 @@ class SimBridge:
     def _tick(self, dt: float) -> None:
         all_cars = self._world.all_cars()
 
-        # 1. Build local neighbourhood view for each car.
-        others_by_id: Dict[str, List[Car]] = {}
-        for ego in all_cars:
-            others_by_id[ego.id] = [other for other in all_cars if other is not ego]
+        # 1. One state snapshot per tick; each car's neighbourhood view is
+        #    that list minus its own entry.
+        snapshot = self._world.snapshot_cars()
 
         # 2. Each car broadcasts its *state* on the V2V channel.
         #    (No decision here — just position, speed, sign, neighbours.)
-        for car in all_cars:
+        for idx, car in enumerate(all_cars):
             self._bus.publish(
                 topic="v2v.state",
                 sender=car.id,
                 payload=car.state_payload(
                     sign=self._world.sign_for_car(car),
-                    others=others_by_id[car.id],
+                    snapshot=snapshot,
+                    index=idx,
                 ),
             )
 
         # 3. Infrastructure / edge ML: compute a decision for every car.
         raw_decisions: Dict[str, Dict[str, Any]] = {}
-        for car in all_cars:
-            raw_decisions[car.id] = self._infer_for_car(car, others_by_id[car.id])
+        for idx, car in enumerate(all_cars):
+            raw_decisions[car.id] = self._infer_for_car(car, snapshot, idx)
 
         # 4. Publish each ML decision on the I2V command channel.
         #    These messages are subject to bus drop_rate & latency_ms,
@@ -8,9 +8,11 @@ from __future__ import annotations
 import math
 import unittest
 
+import numpy as np
+
 from sim.network import IntersectionNode, RoadNetwork, RoadSegment
-from sim.traffic_policy import SafetyPolicy
-from sim.world import Car, World
+from sim.traffic_policy import SafetyPolicy, danger_score
+from sim.world import _GUARD_MASK_MIN_PAIRS, Car, World
 
 _EMERGENCY_ROLES = {"ambulance", "police", "fire"}
 
@@ -411,6 +413,114 @@ class WorldSafetyTests(unittest.TestCase):
         yielder = world._pick_yielder(emergency, civilian)
         self.assertIs(yielder, civilian)
 
+    def test_vectorised_move_matches_car_move(self) -> None:
+        world = World(num_cars=64, seed=21)
+        expected = []
+        for car in world.cars:
+            clone = Car(
+                id=car.id, x=car.x, y=car.y, speed=car.speed,
+                ml_direction=car.ml_direction, approach=car.approach,
+                cruise_speed=car.cruise_speed, vx=car.vx, vy=car.vy,
+            )
+            clone.move(0.1)
+            expected.append((clone.x, clone.y))
+        world.cars[0].stopped = True
+        expected[0] = (world.cars[0].x, world.cars[0].y)
+
+        # Open a tick window with the mirror loaded, as the guard does.
+        world._tick_danger = {}
+        world._car_state()
+        world._move_cars(0.1)
+
+        self.assertEqual([(c.x, c.y) for c in world.cars], expected)
+
+    def test_vectorised_speed_targets_match_scalar(self) -> None:
+        world = World(num_cars=16, seed=13)
+        targets = [(0.0, 1.0, 25.0, 60.0)[idx % 4] for idx in range(len(world.cars))]
+        for idx, car in enumerate(world.cars):
+            car.speed = (0.5, 4.0, 30.0)[idx % 3]
+        world._state.load(world.cars, world._int_centers)
+        world._state.apply_speed_targets(np.array(targets), 0.1, world.policy)
+
+        world._apply_speed_targets(targets, 0.1)
+
+        self.assertEqual([c.speed for c in world.cars], world._state.speed.tolist())
+        self.assertEqual([c.wait_s for c in world.cars], world._state.wait_s.tolist())
+
+    def test_vectorised_danger_scores_match_scalar(self) -> None:
+        world = World(num_cars=8, seed=5)
+        world.cars[0].role = "ambulance"
+        world.cars[1].speed = 90.0
+        world.cars[2].wait_s = 14.0
+        world._state.load(world.cars, world._int_centers)
+        scores = world._state.danger_scores(world.policy).tolist()
+        for car, score in zip(world.cars, scores):
+            self.assertEqual(score, danger_score(car, world.policy))
+
+    def test_snapshot_payloads_match_per_car_dicts(self) -> None:
+        world = World(num_cars=6, seed=17)
+        world.update_physics(0.1)
+        snapshot = world.snapshot_cars()
+        decision = {"decision": "GO"}
+        for idx, car in enumerate(world.cars):
+            traffic = [c.as_dict() for c in world.cars if c.id != car.id]
+            self.assertEqual(car.ml_payload("STOP", snapshot, idx, "RED"), {
+                "my_car": car.as_dict(),
+                "sign": "STOP",
+                "traffic_light": "RED",
+                "traffic": traffic,
+            })
+            self.assertEqual(car.state_payload("STOP", snapshot, idx), {
+                "position": car.as_dict(),
+                "sign": "STOP",
+                "traffic": traffic,
+            })
+            self.assertEqual(car.v2x_payload("STOP", snapshot, idx, decision), {
+                "decision": "GO",
+                "position": car.as_dict(),
+                "traffic": traffic,
+                "sign": "STOP",
+            })
+
+    def test_snapshot_rebuilt_when_cars_replaced_within_tick(self) -> None:
+        world = World(num_cars=6, seed=17)
+        world.snapshot_cars()
+        world.cars = list(reversed(world.cars))
+        self.assertEqual(world.snapshot_cars(), [c.as_dict() for c in world.cars])
+
+    def test_vectorised_guard_screen_covers_scalar_check(self) -> None:
+        world = World(num_cars=28, seed=8)
+        dt = 0.1
+        vectorised = 0
+        guarded = 0
+        for tick in range(300):
+            targets = [
+                car.cruise_speed * (0.0, 0.5, 1.0)[(idx + tick) % 3]
+                for idx, car in enumerate(world.cars)
+            ]
+            pairs = world._guard_candidate_pairs(targets, dt)
+            mask = world._guard_pair_mask(pairs, targets, dt)
+            cars = world.cars
+            accepted = {
+                (i, j)
+                for i in range(len(cars))
+                for j in range(i + 1, len(cars))
+                if not (cars[i].passed and cars[j].passed)
+                and world._pair_needs_guard(cars[i], cars[j], targets[i], targets[j], dt)
+            }
+            self.assertLessEqual(accepted, set(pairs), tick)
+            if len(pairs) >= _GUARD_MASK_MIN_PAIRS:
+                vectorised += 1
+            for (i, j), hit in zip(pairs, mask):
+                needed = world._pair_needs_guard(
+                    world.cars[i], world.cars[j], targets[i], targets[j], dt,
+                )
+                guarded += needed
+                self.assertGreaterEqual(hit, needed, (tick, i, j))
+            world.update_physics(dt)
+        self.assertGreater(vectorised, 0)
+        self.assertGreater(guarded, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
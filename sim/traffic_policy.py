@@ -6,17 +6,24 @@ Tunable safety, physics and scheduling parameters for the intersection
 simulation.  Every constant lives in the frozen :class:`SafetyPolicy`
 dataclass so that experiments can swap policies without touching code.
 
-Also provides three stateless scoring / distance helpers:
+Also provides stateless scoring / distance helpers:
 
 * :func:`danger_score` — scheduling priority for a vehicle.
+* :func:`danger_score_array` — the same, for a vector of vehicles.
 * :func:`pair_safe_distance_m` — dynamic minimum pair distance.
+* :func:`pair_safe_distance_fn` — the same, specialised for one policy.
+* :func:`pair_safe_distance_array` — the same, broadcast over speed arrays.
 * :func:`braking_distance_m` — constant-deceleration stopping distance.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
+
+import numpy as np
+
+from sim.physics import KMH_TO_MPS
 
 
 @dataclass(frozen=True)
@@ -174,9 +181,14 @@ _ROLE_WEIGHT = {
 }
 
 
+def role_weight(role: Any) -> float:
+    """Scheduling bonus for a vehicle *role* (unknown roles score 0)."""
+    return _ROLE_WEIGHT.get(str(role).lower(), 0.0)
+
+
 def to_mps(speed_kmh: float) -> float:
     """Convert km/h to m/s, clamping negatives to zero."""
-    return max(0.0, float(speed_kmh)) / 3.6
+    return max(0.0, float(speed_kmh)) * KMH_TO_MPS
 
 
 def braking_distance_m(speed_kmh: float, max_brake_kmh_s: float) -> float:
@@ -190,7 +202,7 @@ def braking_distance_m(speed_kmh: float, max_brake_kmh_s: float) -> float:
         Braking deceleration in km/h per second.
     """
     v = to_mps(speed_kmh)
-    decel_mps2 = max(0.1, max_brake_kmh_s / 3.6)
+    decel_mps2 = max(0.1, max_brake_kmh_s * KMH_TO_MPS)
     return (v * v) / (2.0 * decel_mps2)
 
 
@@ -212,6 +224,53 @@ def pair_safe_distance_m(car_a: Any, car_b: Any, policy: SafetyPolicy) -> float:
     return max(policy.min_pair_distance_m, min(policy.max_pair_distance_m, safe))
 
 
+def pair_safe_distance_fn(policy: SafetyPolicy) -> Callable[[Any, Any], float]:
+    """Return :func:`pair_safe_distance_m` with *policy* folded in.
+
+    The policy is frozen, so its derived constants (base radius, braking
+    denominator, clamp bounds) are computed once and captured; the
+    returned ``f(car_a, car_b)`` repeats the original arithmetic in the
+    same order and returns identical values.
+    """
+    reaction_s = policy.reaction_time_s
+    two_decel = 2.0 * max(0.1, policy.max_brake_kmh_s * KMH_TO_MPS)
+    base = max(policy.min_pair_distance_m, policy.base_collision_radius_m * 2.0)
+    lo = policy.min_pair_distance_m
+    hi = policy.max_pair_distance_m
+
+    def safe_distance(car_a: Any, car_b: Any) -> float:
+        va = max(0.0, float(car_a.speed)) * KMH_TO_MPS
+        vb = max(0.0, float(car_b.speed)) * KMH_TO_MPS
+        reaction = (va + vb) * reaction_s * 0.5
+        braking = ((va * va) / two_decel + (vb * vb) / two_decel) * 0.5
+        return max(lo, min(hi, base + reaction + 0.35 * braking))
+
+    return safe_distance
+
+
+def pair_safe_distance_array(
+    speed_a_kmh: np.ndarray,
+    speed_b_kmh: np.ndarray,
+    policy: SafetyPolicy,
+) -> np.ndarray:
+    """Vectorised :func:`pair_safe_distance_m` for cars with speeds
+    *speed_a_kmh* and *speed_b_kmh*.
+
+    The two arrays broadcast against each other, so equal-length vectors
+    give one distance per pair and ``a[:, None]`` / ``b[None, :]`` give
+    the full table.
+    """
+    decel_mps2 = max(0.1, policy.max_brake_kmh_s * KMH_TO_MPS)
+    va = np.maximum(speed_a_kmh, 0.0) * KMH_TO_MPS
+    vb = np.maximum(speed_b_kmh, 0.0) * KMH_TO_MPS
+    reaction = (va + vb) * policy.reaction_time_s * 0.5
+    braking = ((va * va) / (2.0 * decel_mps2) + (vb * vb) / (2.0 * decel_mps2)) * 0.5
+    base = max(policy.min_pair_distance_m, policy.base_collision_radius_m * 2.0)
+    safe = base + reaction + 0.35 * braking
+    return np.maximum(policy.min_pair_distance_m,
+                      np.minimum(policy.max_pair_distance_m, safe))
+
+
 def danger_score(car: Any, policy: SafetyPolicy) -> float:
     """Scheduling-priority score for *car*.
 
@@ -225,8 +284,7 @@ def danger_score(car: Any, policy: SafetyPolicy) -> float:
     overspeed = max(0.0, speed - speed_limit) / speed_limit
     stop_dist = braking_distance_m(speed, policy.max_brake_kmh_s)
     wait_s = max(0.0, float(getattr(car, "wait_s", 0.0)))
-    role = str(getattr(car, "role", "civilian")).lower()
-    role_bonus = _ROLE_WEIGHT.get(role, 0.0)
+    role_bonus = role_weight(getattr(car, "role", "civilian"))
     return (
         role_bonus
         + speed_factor
@@ -234,3 +292,27 @@ def danger_score(car: Any, policy: SafetyPolicy) -> float:
         + min(2.0, stop_dist / 35.0)
         + min(2.0, wait_s / 6.0)
     )
+
+
+def danger_score_array(
+    speed_kmh: np.ndarray,
+    speed_limit_kmh: np.ndarray,
+    wait_s: np.ndarray,
+    role_bonus: np.ndarray,
+    policy: SafetyPolicy,
+) -> np.ndarray:
+    """Vectorised :func:`danger_score`; element *i* matches car *i*."""
+    speed = np.maximum(0.0, speed_kmh)
+    speed_limit = np.maximum(1.0, speed_limit_kmh)
+    speed_factor = np.minimum(2.0, speed / speed_limit)
+    overspeed = np.maximum(0.0, speed - speed_limit) / speed_limit
+    v = speed * KMH_TO_MPS
+    stop_dist = (v * v) / (2.0 * max(0.1, policy.max_brake_kmh_s * KMH_TO_MPS))
+    wait = np.maximum(0.0, wait_s)
+    return (
+        role_bonus
+        + speed_factor
+        + (1.2 * overspeed)
+        + np.minimum(2.0, stop_dist / 35.0)
+        + np.minimum(2.0, wait / 6.0)
+    )
@@ -16,20 +16,44 @@ import logging
 import math
 import random
 from dataclasses import dataclass, field
+from itertools import accumulate
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+from sim.car_arrays import APPROACHES, CarArrays
 from sim.traffic_policy import (
     SafetyPolicy,
     danger_score,
-    pair_safe_distance_m,
+    pair_safe_distance_fn,
+    pair_safe_distance_array,
 )
 from sim.network import IntersectionNode, RoadNetwork, default_network
+from sim.physics import KMH_TO_MPS
 
 log = logging.getLogger("world")
 
 _ML_DIRECTIONS: Tuple[str, ...] = ("FORWARD", "LEFT", "RIGHT")
 _APPROACHES: Tuple[str, ...] = ("W", "N", "E", "S")
 _EMERGENCY_ROLES: Tuple[str, ...] = ("ambulance", "police", "fire")
+# Role string → emergency flag, memoised by ``World._is_emergency_role``.
+# Roles and priority flags change at runtime, so the flag is looked up
+# per call rather than stored on the car.
+_EMERGENCY_BY_ROLE: Dict[str, bool] = {}
+# Spawn role mix; cumulative weights are what ``random.choices`` builds
+# from ``weights=`` on every call, so precomputing keeps the draws identical.
+_SPAWN_ROLES: Tuple[str, ...] = ("civilian", "ambulance", "police")
+_SPAWN_ROLE_CUM_WEIGHTS: Tuple[float, ...] = tuple(accumulate((0.94, 0.03, 0.03)))
+# Below this many screened pairs the scalar guard check beats the kernel.
+_GUARD_MASK_MIN_PAIRS: int = 12
+# Below this many cars the per-car loops beat loading the CarArrays mirror.
+_VECTOR_MIN_CARS: int = 12
+# The vectorised move only pays off on a mirror the tick already loaded
+# (signal or guard), and only in large worlds; the write-back is per car.
+_MOVE_VECTOR_MIN_CARS: int = 64
+# Overlap pushes force a matrix refresh each, so the pairwise resolver
+# stays cheaper up to a much larger world.
+_OVERLAP_MATRIX_MIN_CARS: int = 48
 
 # Semaphore phase names
 _PHASE_GREEN  = "GREEN"
@@ -107,7 +131,7 @@ _TURN_TRIGGER: Dict[str, float] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Car:
     """A standalone vehicle entity.
 
@@ -169,7 +193,7 @@ class Car:
         """Advance the car — follow turn waypoints if active, else straight."""
         if self.stopped:
             return
-        speed_mps = self.speed / 3.6
+        speed_mps = self.speed * KMH_TO_MPS
         if self._turn_waypoints:
             self._move_along_waypoints(speed_mps, dt)
         else:
@@ -222,17 +246,11 @@ class Car:
                    cx: float = 0.0, cy: float = 0.0) -> bool:
         """True once the car is *threshold* metres past *cx, cy*
         along its travel axis.
+
+        The heading is a cardinal unit vector outside turns, so the
+        signed projection onto it is exactly the offset along that axis.
         """
-        rx, ry = self.x - cx, self.y - cy
-        if self.vx > 0 and rx > threshold:
-            return True
-        if self.vx < 0 and rx < -threshold:
-            return True
-        if self.vy > 0 and ry > threshold:
-            return True
-        if self.vy < 0 and ry < -threshold:
-            return True
-        return False
+        return self.vx * (self.x - cx) + self.vy * (self.y - cy) > threshold
 
     def as_dict(self) -> dict:
         """Serialisable mapping of ``id``, ``x``, ``y``, ``speed``,
@@ -247,50 +265,73 @@ class Car:
             "role": self.role,
         }
 
-    def ml_payload(self, sign: str, others: Sequence["Car"],
-                   traffic_light: str = "NONE") -> Dict[str, Any]:
+    def ml_payload(self, sign: str, snapshot: Sequence[Dict[str, Any]],
+                   index: int, traffic_light: str = "NONE") -> Dict[str, Any]:
         """Build the JSON-compatible dict expected by
         :func:`ml.comunication.Inference.fa_inferenta_din_json`.
+
+        *snapshot* is :meth:`World.snapshot_cars` and *index* this car's
+        position in it; the payload shares those dicts (read-only).
         """
         return {
-            "my_car": self.as_dict(),
+            "my_car": snapshot[index],
             "sign": sign,
             "traffic_light": traffic_light,
-            "traffic": [car.as_dict() for car in others if car.id != self.id],
+            "traffic": _others(snapshot, index),
         }
 
-    def state_payload(self, sign: str, others: Sequence["Car"]) -> Dict[str, Any]:
+    def state_payload(self, sign: str, snapshot: Sequence[Dict[str, Any]],
+                      index: int) -> Dict[str, Any]:
         """
         Build a V2X *state-only* payload (no decision).
 
         This is what a real car would broadcast on the V2V channel:
         its own position/speed plus the sign it sees and neighbours
         it detects locally.  Decisions travel on a separate topic.
+        *snapshot* / *index* as for :meth:`ml_payload`.
         """
         return {
-            "position": self.as_dict(),
+            "position": snapshot[index],
             "sign": sign,
-            "traffic": [car.as_dict() for car in others if car.id != self.id],
+            "traffic": _others(snapshot, index),
         }
 
     def v2x_payload(
         self,
         sign: str,
-        others: Sequence["Car"],
+        snapshot: Sequence[Dict[str, Any]],
+        index: int,
         decision: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Build V2X payload emitted by this car's communication unit."""
         payload = dict(decision)
         payload.update(
             {
-                "position": self.as_dict(),
-                "traffic": [car.as_dict() for car in others if car.id != self.id],
+                "position": snapshot[index],
+                "traffic": _others(snapshot, index),
                 "sign": sign,
             }
         )
         return payload
 
 
+def _lookup_sign(table: Dict[str, str], approach: str) -> str:
+    """Sign for *approach* in *table*, ``NO_SIGN`` if absent.
+
+    Approaches are stored as canonical ``W``/``N``/``E``/``S`` keys, so the
+    direct lookup hits on the hot path; normalising is the fallback.
+    """
+    sign = table.get(approach)
+    if sign is None:
+        sign = table.get(str(approach).upper(), "NO_SIGN")
+    return sign
+
+
+def _others(snapshot: Sequence[Dict[str, Any]], index: int) -> List[Dict[str, Any]]:
+    """Every entry of *snapshot* except the ego at *index*."""
+    return [*snapshot[:index], *snapshot[index + 1:]]
+
+
 class World:
     """Entity-based multi-intersection scenario.
 
@@ -334,6 +375,29 @@ class World:
         self.num_cars = max(1, int(num_cars))
         self._rng = random.Random(seed)
         self.cars: List[Car] = []
+        # Uniform spawn hash: cell → cars, cell size = policy.spawn_min_gap_m.
+        self._spawn_grid: Dict[Tuple[int, int], List[Car]] = {}
+        # Struct-of-arrays mirror of ``self.cars`` for vectorised tick work;
+        # ``_state_fresh`` marks it current within a tick (see ``_car_state``).
+        self._state = CarArrays()
+        self._state_fresh: bool = False
+        # ``pair_safe_distance_m`` specialised for this world's policy.
+        self._pair_safe = pair_safe_distance_fn(self.policy)
+        # Per-tick danger scores (car id → score), valid from the start of
+        # a tick until speeds change in ``_move_cars``; ``None``
+        # outside that window, empty until first requested.
+        self._tick_danger: Optional[Dict[str, float]] = None
+        self._int_centers: Dict[str, Tuple[float, float]] = {
+            nid: (node.cx, node.cy)
+            for nid, node in self.network.intersections.items()
+        }
+        self._int_index: Dict[str, int] = {
+            nid: idx for idx, nid in enumerate(self.network.intersections)
+        }
+        self._int_has_sem: Dict[str, bool] = {
+            nid: node.has_semaphore
+            for nid, node in self.network.intersections.items()
+        }
         self.safety_interventions: int = 0
         self.collision_resolutions: int = 0
         self.green_approach: str = "W"
@@ -373,8 +437,15 @@ class World:
         self._scenario_index = World._scenario_counter
 
         self.cars = []
+        self._spawn_grid = {}
+        self._snapshot: List[Dict[str, Any]] = []
+        self._snapshot_tick = -1
+        self._snapshot_cars: Optional[List[Car]] = None
+        terminal_arms = self.network.terminal_arms()
         for idx in range(self.num_cars):
-            self.cars.append(self._make_random_car(idx))
+            car = self._make_random_car(idx, terminal_arms)
+            self.cars.append(car)
+            self._spawn_grid.setdefault(self._spawn_cell(car.x, car.y), []).append(car)
         self._assign_priority_vehicles(self._priority_target_count())
         self.safety_interventions = 0
         self.collision_resolutions = 0
@@ -407,7 +478,29 @@ class World:
         return self._finished
 
     def all_cars(self) -> List[Car]:
-        return list(self.cars)
+        """The live car list — treat it as read-only.
+
+        ``_init_cars`` rebinds ``cars`` to a fresh list instead of
+        mutating it, so a caller iterating the returned list across a
+        reset keeps a consistent view.
+        """
+        return self.cars
+
+    def snapshot_cars(self) -> List[Dict[str, Any]]:
+        """:meth:`Car.as_dict` of every car, index-aligned with ``cars``.
+
+        Built once per physics tick and shared by every ego's payload;
+        callers must treat the dicts as read-only.  Rebuilt early if
+        ``cars`` is replaced or changes length within the tick.
+        """
+        cars = self.cars
+        if (self._snapshot_tick != self._tick_count
+                or self._snapshot_cars is not cars
+                or len(self._snapshot) != len(cars)):
+            self._snapshot = [car.as_dict() for car in cars]
+            self._snapshot_tick = self._tick_count
+            self._snapshot_cars = cars
+        return self._snapshot
 
     def get_signs(self) -> Dict[str, str]:
         return dict(self.signs_by_approach)
@@ -417,11 +510,11 @@ class World:
         return dict(self._signs.get(int_id, self.signs_by_approach))
 
     def sign_for_approach(self, approach: str) -> str:
-        return self.signs_by_approach.get(str(approach).upper(), "NO_SIGN")
+        return _lookup_sign(self.signs_by_approach, approach)
 
     def sign_for_car(self, car: Car) -> str:
         table = self._signs.get(car.current_int_id, self.signs_by_approach)
-        return table.get(str(car.approach).upper(), "NO_SIGN")
+        return _lookup_sign(table, car.approach)
 
     # ── physics tick ──────────────────────────────────────────────────────
 
@@ -439,6 +532,8 @@ class World:
         decisions = decisions or {}
         self._tick_count += 1
         tick = self._tick_count
+        self._tick_danger = {}
+        self._state_fresh = False
         if self.policy.world_signal_scheduler_enabled:
             self._update_virtual_signal(dt)
         if self.policy.semaphore_enabled:
@@ -449,7 +544,7 @@ class World:
         # ── Debug: log car state before collision guard ───────────────
         if tick % 10 == 1:
             log.debug("=== TICK %d ===", tick)
-            for car in self.cars:
+            for car, car_target in zip(self.cars, targets):
                 sign = self.sign_for_car(car)
                 dist = self._distance_to_stop_line(car)
                 dec = decisions.get(car.id, {})
@@ -470,30 +565,27 @@ class World:
                     sem_color, car.speed, car.cruise_speed,
                     sign, dist, car.passed, car.is_turning, car.has_turned,
                     car.stopped, car.stop_wait_s, car.stop_completed, ml_dec,
-                    targets.get(car.id, -1),
+                    car_target,
                 )
 
         if self.policy.world_collision_guard_enabled:
             interventions = self._apply_collision_guard(targets, dt, tick)
             self.safety_interventions += interventions
 
-        self._apply_speed_targets(targets, dt)
-
-        for car in self.cars:
-            car.move(dt)
+        self._move_cars(dt, targets)
+        self._tick_danger = None
 
         self._apply_turns()
 
+        threshold = self.policy.pass_threshold_m
+        centers = self._int_centers
+        origin = (0.0, 0.0)
         for car in self.cars:
             # Don't mark a car as "passed" while it's still following
             # turn waypoints — the intermediate velocity isn't cardinal
             # and the car hasn't reached the exit lane yet.
-            node = self.network.intersections.get(car.current_int_id)
-            cx = node.cx if node else 0.0
-            cy = node.cy if node else 0.0
-            threshold = self.policy.pass_threshold_m
-            actually_passed = car.has_passed(threshold, cx, cy)
-            if not car.passed and not car.is_turning and actually_passed:
+            if (not car.passed and not car.is_turning
+                    and car.has_passed(threshold, *centers.get(car.current_int_id, origin))):
                 # Check if car should transition to next intersection
                 next_int = self._next_intersection_for(car)
                 exit_arm = self._exit_arm(car)
@@ -540,6 +632,84 @@ class World:
         if all(c.passed for c in self.cars):
             self._finished = True
 
+    def _move_cars(self, dt: float, targets: Optional[Sequence[float]] = None) -> None:
+        """Advance every car by *dt* seconds.
+
+        When *targets* (km/h, index-aligned with ``cars``) is given,
+        speeds are first ramped toward them — acceleration / braking
+        limits, anti-creep filter and wait-time bookkeeping.  With at
+        least ``_MOVE_VECTOR_MIN_CARS`` cars and a mirror already loaded
+        this tick, this runs over the :class:`~sim.car_arrays.CarArrays`
+        mirror and straight-moving cars are integrated in one vectorised
+        step; otherwise, and for cars following turn waypoints, every car
+        uses :meth:`Car.move`.
+        """
+        cars = self.cars
+        if len(cars) < _MOVE_VECTOR_MIN_CARS or not self._state_fresh:
+            if targets is not None:
+                self._apply_speed_targets(targets, dt)
+            for car in cars:
+                car.move(dt)
+            self._state_fresh = False
+            return
+        state = self._car_state()
+        self._state_fresh = False
+        if targets is not None:
+            target = np.array(targets, dtype=np.float64)
+            state.apply_speed_targets(target, dt, self.policy)
+            for car, speed, wait_s in zip(cars, state.speed.tolist(), state.wait_s.tolist()):
+                car.speed = speed
+                car.wait_s = wait_s
+        moved = state.advance_straight(dt)
+        xs = state.x.tolist()
+        ys = state.y.tolist()
+        for idx in np.flatnonzero(moved).tolist():
+            car = cars[idx]
+            car.x = xs[idx]
+            car.y = ys[idx]
+        for idx in np.flatnonzero(state.turning).tolist():
+            cars[idx].move(dt)
+
+    def _apply_speed_targets(self, targets: Sequence[float], dt: float) -> None:
+        """Per-car :meth:`CarArrays.apply_speed_targets` for small worlds."""
+        policy = self.policy
+        for car, car_target in zip(self.cars, targets):
+            target = max(0.0, float(car_target))
+
+            # Choose acceleration rate: use green-launch boost when
+            # accelerating from near-standstill toward a high target.
+            accel = policy.max_accel_kmh_s
+            if (target >= car.cruise_speed * 0.8
+                    and car.speed < policy.creep_filter_kmh * 2):
+                accel = policy.green_launch_accel_kmh_s
+
+            if car.speed > target:
+                car.speed = max(target, car.speed - policy.max_brake_kmh_s * dt)
+            elif car.speed < target:
+                car.speed = min(target, car.speed + accel * dt)
+
+            # Anti-creep filter: snap very low speeds to zero
+            if car.speed < policy.creep_filter_kmh and target < policy.creep_filter_kmh:
+                car.speed = 0.0
+
+            if car.speed < 1.0:
+                car.wait_s += dt
+            else:
+                car.wait_s = max(0.0, car.wait_s - 0.25 * dt)
+
+    def _car_state(self) -> CarArrays:
+        """``self._state`` loaded for the current car positions.
+
+        Within a tick (while the danger cache is open) the mirror is
+        loaded once and shared by the signal, guard and move steps until
+        a car moves; outside that window every call reloads it.
+        """
+        state = self._state
+        if not self._state_fresh:
+            state.load(self.cars, self._int_centers)
+            self._state_fresh = self._tick_danger is not None
+        return state
+
     # ── Legacy compatibility ──────────────────────────────────────────────
 
     def get_ml_input(self) -> dict:
@@ -554,10 +724,11 @@ class World:
                 "traffic": [],
             }
         ego = self.cars[0]
+        snapshot = self.snapshot_cars()
         return {
-            "my_car": ego.as_dict(),
+            "my_car": snapshot[0],
             "sign": self.sign_for_car(ego),
-            "traffic": [car.as_dict() for car in self.cars[1:]],
+            "traffic": snapshot[1:],
         }
 
     # ── spawning ──────────────────────────────────────────────────────────
@@ -642,7 +813,10 @@ class World:
 
     @staticmethod
     def _is_emergency_role(role: str) -> bool:
-        return str(role).lower() in _EMERGENCY_ROLES
+        flag = _EMERGENCY_BY_ROLE.get(role)
+        if flag is None:
+            flag = _EMERGENCY_BY_ROLE[role] = str(role).lower() in _EMERGENCY_ROLES
+        return flag
 
     def _sync_priority_and_role(self) -> None:
         """Make emergency role and priority flag represent the same state."""
@@ -654,27 +828,32 @@ class World:
                 if self._is_emergency_role(car.role):
                     car.role = "civilian"
 
-    def _make_random_car(self, idx: int) -> Car:
+    def _make_random_car(
+        self,
+        idx: int,
+        terminal_arms: Optional[List[Tuple[str, str]]] = None,
+    ) -> Car:
         """
         Spawn one car on a random terminal arm of the road network.
+
+        *terminal_arms* lets a batch spawn reuse one
+        :meth:`RoadNetwork.terminal_arms` scan.
         """
-        terminal_arms = self.network.terminal_arms()
-        int_id, arm = self._rng.choice(terminal_arms)
+        if terminal_arms is None:
+            terminal_arms = self.network.terminal_arms()
+        rng = self._rng
+        int_id, arm = rng.choice(terminal_arms)
 
-        speed = self._rng.uniform(60.0, self.policy.speed_limit_kmh + 10.0)
-        ml_direction = self._rng.choice(_ML_DIRECTIONS)
-        role = self._rng.choices(
-            ("civilian", "ambulance", "police"),
-            weights=(0.94, 0.03, 0.03),
-            k=1,
-        )[0]
+        speed = rng.uniform(60.0, self.policy.speed_limit_kmh + 10.0)
+        ml_direction = rng.choice(_ML_DIRECTIONS)
+        role = rng.choices(_SPAWN_ROLES, cum_weights=_SPAWN_ROLE_CUM_WEIGHTS, k=1)[0]
 
         if role in ("ambulance", "police"):
             speed *= 1.1
 
         pos: Optional[Tuple[float, float, float, float]] = None
         for _ in range(self.policy.spawn_max_attempts):
-            distance = self._rng.uniform(self.policy.spawn_min_radius_m, self.policy.spawn_max_radius_m)
+            distance = rng.uniform(self.policy.spawn_min_radius_m, self.policy.spawn_max_radius_m)
             candidate = self.network.arm_spawn_position(
                 int_id, arm, distance, self.policy.lane_offset_m,
             )
@@ -683,7 +862,7 @@ class World:
                 break
 
             # Try another terminal arm if this lane is crowded.
-            int_id, arm = self._rng.choice(terminal_arms)
+            int_id, arm = rng.choice(terminal_arms)
 
         if pos is None:
             # Deterministic fallback: cycle through terminal arms.
@@ -773,10 +952,32 @@ class World:
                 car._turn_waypoints,
             )
 
+    def _spawn_cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Spawn-grid cell containing *(x, y)*."""
+        gap = self.policy.spawn_min_gap_m
+        if gap <= 0.0:
+            return (0, 0)
+        return (math.floor(x / gap), math.floor(y / gap))
+
     def _spawn_is_clear(self, x: float, y: float) -> bool:
-        for car in self.cars:
-            if math.hypot(car.x - x, car.y - y) < self.policy.spawn_min_gap_m:
-                return False
+        """True when no spawned car lies within ``spawn_min_gap_m``.
+
+        Cells are one gap wide, so only the 3x3 block around *(x, y)*
+        can hold a car that close.
+        """
+        gap = self.policy.spawn_min_gap_m
+        if gap <= 0.0:
+            return True
+        gap_sq = gap * gap
+        gx, gy = self._spawn_cell(x, y)
+        grid = self._spawn_grid
+        for cx in (gx - 1, gx, gx + 1):
+            for cy in (gy - 1, gy, gy + 1):
+                for car in grid.get((cx, cy), ()):
+                    dx = car.x - x
+                    dy = car.y - y
+                    if dx * dx + dy * dy < gap_sq:
+                        return False
         return True
 
     def _next_intersection_for(self, car: Car) -> Optional[IntersectionNode]:
@@ -842,8 +1043,9 @@ class World:
 
     # ── safety / control ─────────────────────────────────────────────────
 
-    def _build_target_speeds(self, decisions: Dict[str, Dict[str, Any]], dt: float = 0.1) -> Dict[str, float]:
-        targets: Dict[str, float] = {}
+    def _build_target_speeds(self, decisions: Dict[str, Dict[str, Any]], dt: float = 0.1) -> List[float]:
+        """Target speed (km/h) per car, index-aligned with ``cars``."""
+        targets: List[float] = []
         for car in self.cars:
             raw_decision = decisions.get(car.id, {})
             if isinstance(raw_decision, dict):
@@ -853,8 +1055,10 @@ class World:
             target = self._target_speed_from_decision(car, decision_payload)
             if self.policy.world_signal_scheduler_enabled and self._must_yield_to_signal(car):
                 cx, cy = self._int_center(car)
-                dist = math.hypot(car.x - cx, car.y - cy)
-                if dist <= self.policy.red_hard_radius_m:
+                dx = car.x - cx
+                dy = car.y - cy
+                hard_r = self.policy.red_hard_radius_m
+                if dx * dx + dy * dy <= hard_r * hard_r:
                     target = 0.0
                 else:
                     target = min(target, self.policy.red_soft_speed_kmh)
@@ -943,7 +1147,7 @@ class World:
                 else:
                     target = min(target, self.policy.intersection_speed_cap_kmh)
 
-            targets[car.id] = target
+            targets.append(target)
         return targets
 
     def _target_speed_from_decision(self, car: Car, decision_payload: Dict[str, Any]) -> float:
@@ -972,32 +1176,7 @@ class World:
             return max(0.0, self.policy.ml_stop_target_speed_kmh)
         return car.cruise_speed
 
-    def _apply_speed_targets(self, targets: Dict[str, float], dt: float) -> None:
-        for car in self.cars:
-            target = max(0.0, float(targets.get(car.id, car.cruise_speed)))
-
-            # Choose acceleration rate: use green-launch boost when
-            # accelerating from near-standstill toward a high target.
-            accel = self.policy.max_accel_kmh_s
-            if (target >= car.cruise_speed * 0.8
-                    and car.speed < self.policy.creep_filter_kmh * 2):
-                accel = self.policy.green_launch_accel_kmh_s
-
-            if car.speed > target:
-                car.speed = max(target, car.speed - self.policy.max_brake_kmh_s * dt)
-            elif car.speed < target:
-                car.speed = min(target, car.speed + accel * dt)
-
-            # Anti-creep filter: snap very low speeds to zero
-            if car.speed < self.policy.creep_filter_kmh and target < self.policy.creep_filter_kmh:
-                car.speed = 0.0
-
-            if car.speed < 1.0:
-                car.wait_s += dt
-            else:
-                car.wait_s = max(0.0, car.wait_s - 0.25 * dt)
-
-    def _apply_collision_guard(self, targets: Dict[str, float], dt: float, tick: int = 0) -> int:
+    def _apply_collision_guard(self, targets: List[float], dt: float, tick: int = 0) -> int:
         interventions = 0
         n = len(self.cars)
         if n < 2:
@@ -1007,112 +1186,131 @@ class World:
         # Runs FIRST so that hard-stops propagate to the following-
         # distance guard below (followers must see the leader's
         # reduced target, not its stale cruise speed).
+        screened = self._guard_candidate_pairs(targets, dt)
+        maybe_screened = self._guard_pair_mask(screened, targets, dt)
+        # Cars whose target dropped since the mask was computed.
+        dirty: set = set()
         for _ in range(3):
-            for i in range(n):
+            pairs = screened
+            maybe = maybe_screened
+            k = 0
+            while k < len(pairs):
+                i, j = pairs[k]
+                hit = maybe[k]
+                k += 1
+                if not hit and i not in dirty and j not in dirty:
+                    continue
                 a = self.cars[i]
-                for j in range(i + 1, n):
-                    b = self.cars[j]
-
-                    # Skip pairs where both cars already passed the intersection.
-                    if a.passed and b.passed:
-                        continue
-
-                    if not self._pair_needs_guard(a, b, targets, dt):
-                        continue
-
-                    safe_dist = pair_safe_distance_m(a, b, self.policy)
-                    now_dist = math.hypot(a.x - b.x, a.y - b.y)
-                    yielder = self._pick_yielder(a, b)
-                    current = targets.get(yielder.id, yielder.cruise_speed)
-
-                    # If the yielder hasn't entered the intersection yet,
-                    # hold it at the stop line instead of letting it creep in.
-                    dist_to_line = self._distance_to_stop_line(yielder)
-                    yielder_outside = dist_to_line > 0.0 and not yielder.passed
-
-                    if now_dist <= safe_dist * 0.78:
-                        # Very close — hard stop.
-                        new_target = 0.0
-                        xreason = "VERY CLOSE hard stop"
-
-                        # ── Backtrack: nudge the yielder backward when
-                        #    dangerously close inside the intersection.
-                        yielder_in_box = self._car_in_intersection(yielder)
-                        if yielder_in_box and now_dist < safe_dist * 0.5:
-                            bt = self.policy.intersection_backtrack_m
-                            yielder.x -= yielder.vx * bt
-                            yielder.y -= yielder.vy * bt
-                            xreason = f"BACKTRACK {bt:.1f}m"
-                    elif yielder_outside and dist_to_line < 3.0:
-                        # Near the stop line — hard stop to prevent creeping in.
+                b = self.cars[j]
+                if not self._pair_needs_guard(a, b, targets[i], targets[j], dt):
+                    continue
+
+                safe_dist = self._pair_safe(a, b)
+                now_dist = math.hypot(a.x - b.x, a.y - b.y)
+                yielder = self._pick_yielder(a, b)
+                yi = i if yielder is a else j
+                current = targets[yi]
+
+                # If the yielder hasn't entered the intersection yet,
+                # hold it at the stop line instead of letting it creep in.
+                dist_to_line = self._distance_to_stop_line(yielder)
+                yielder_outside = dist_to_line > 0.0 and not yielder.passed
+
+                if now_dist <= safe_dist * 0.78:
+                    # Very close — hard stop.
+                    new_target = 0.0
+                    xreason = "VERY CLOSE hard stop"
+
+                    # ── Backtrack: nudge the yielder backward when
+                    #    dangerously close inside the intersection.
+                    yielder_in_box = self._car_in_intersection(yielder)
+                    if yielder_in_box and now_dist < safe_dist * 0.5:
+                        bt = self.policy.intersection_backtrack_m
+                        yielder.x -= yielder.vx * bt
+                        yielder.y -= yielder.vy * bt
+                        xreason = f"BACKTRACK {bt:.1f}m"
+                        # Positions moved — re-screen the pairs still ahead.
+                        self._state_fresh = False
+                        screened = self._guard_candidate_pairs(targets, dt)
+                        maybe_screened = self._guard_pair_mask(screened, targets, dt)
+                        dirty = set()
+                        pairs = [p for p in screened if p > (i, j)]
+                        maybe = [m for p, m in zip(screened, maybe_screened) if p > (i, j)]
+                        k = 0
+                elif yielder_outside and dist_to_line < 3.0:
+                    # Near the stop line — hard stop to prevent creeping in.
+                    new_target = 0.0
+                    xreason = "NEAR LINE hard stop"
+                elif yielder_outside:
+                    # Approaching — ramp speed down toward the line.
+                    ratio = min(1.0, dist_to_line / self.policy.stop_brake_zone_m)
+                    new_target = min(current, ratio * yielder.cruise_speed)
+                    xreason = f"RAMP ratio={ratio:.2f}"
+                else:
+                    # Yielder already inside the intersection.
+                    other = b if yielder is a else a
+                    both_in_box = (self._car_in_intersection(yielder)
+                                   and self._car_in_intersection(other))
+                    if both_in_box and now_dist < safe_dist * 1.2:
+                        # Both in the box and close — hard stop yielder
                         new_target = 0.0
-                        xreason = "NEAR LINE hard stop"
-                    elif yielder_outside:
-                        # Approaching — ramp speed down toward the line.
-                        ratio = min(1.0, dist_to_line / self.policy.stop_brake_zone_m)
-                        new_target = min(current, ratio * yielder.cruise_speed)
-                        xreason = f"RAMP ratio={ratio:.2f}"
+                        xreason = "IN-BOX CONFLICT hard stop"
                     else:
-                        # Yielder already inside the intersection.
-                        other = b if yielder is a else a
-                        both_in_box = (self._car_in_intersection(yielder)
-                                       and self._car_in_intersection(other))
-                        if both_in_box and now_dist < safe_dist * 1.2:
-                            # Both in the box and close — hard stop yielder
-                            new_target = 0.0
-                            xreason = "IN-BOX CONFLICT hard stop"
-                        else:
-                            new_target = min(current, self.policy.collision_guard_soft_speed_kmh)
-                            xreason = "SOFT CAP"
+                        new_target = min(current, self.policy.collision_guard_soft_speed_kmh)
+                        xreason = "SOFT CAP"
 
-                    if new_target < current:
-                        targets[yielder.id] = new_target
-                        interventions += 1
-                        if tick % 10 == 1:
-                            other = b if yielder is a else a
-                            log.debug(
-                                "  CROSS: %s yields to %s  dist=%.1f safe=%.1f  "
-                                "d2line=%.1f outside=%s  %s  %.1f->%.1f",
-                                yielder.id, other.id, now_dist, safe_dist,
-                                dist_to_line, yielder_outside, xreason,
-                                current, new_target,
-                            )
+                if new_target < current:
+                    targets[yi] = new_target
+                    dirty.add(yi)
+                    interventions += 1
+                    if tick % 10 == 1:
+                        other = b if yielder is a else a
+                        log.debug(
+                            "  CROSS: %s yields to %s  dist=%.1f safe=%.1f  "
+                            "d2line=%.1f outside=%s  %s  %.1f->%.1f",
+                            yielder.id, other.id, now_dist, safe_dist,
+                            dist_to_line, yielder_outside, xreason,
+                            current, new_target,
+                        )
 
         # ── 2.  Same-lane following-distance guard ────────────────────
         # Runs AFTER cross-guard so followers inherit any hard-stop
         # that was applied to their leader above.
-        lane_groups: Dict[Tuple[float, float], List[Car]] = {}
-        for c in self.cars:
+        cars = self.cars
+        lane_groups: Dict[Tuple[float, float], List[int]] = {}
+        for ci, c in enumerate(cars):
             key = (c.vx, c.vy)
-            lane_groups.setdefault(key, []).append(c)
+            lane_groups.setdefault(key, []).append(ci)
 
         for (vx, vy), group in lane_groups.items():
             if len(group) < 2:
                 continue
             # Sort so the car closest to the intersection is first.
             if vx > 0:
-                group.sort(key=lambda c: -c.x)   # W→E: largest x first
+                group.sort(key=lambda ci: -cars[ci].x)   # W→E: largest x first
             elif vx < 0:
-                group.sort(key=lambda c: c.x)     # E→W: smallest x first
+                group.sort(key=lambda ci: cars[ci].x)     # E→W: smallest x first
             elif vy < 0:
-                group.sort(key=lambda c: c.y)     # N→S: smallest y first
+                group.sort(key=lambda ci: cars[ci].y)     # N→S: smallest y first
             elif vy > 0:
-                group.sort(key=lambda c: -c.y)    # S→N: largest y first
+                group.sort(key=lambda ci: -cars[ci].y)    # S→N: largest y first
 
             for idx in range(1, len(group)):
-                leader = group[idx - 1]
-                follower = group[idx]
+                li = group[idx - 1]
+                fi = group[idx]
+                leader = cars[li]
+                follower = cars[fi]
                 gap = self._following_gap(leader, follower)
-                safe = pair_safe_distance_m(leader, follower, self.policy)
+                safe = self._pair_safe(leader, follower)
 
                 if gap < safe * 1.5:
-                    leader_target = targets.get(leader.id, leader.cruise_speed)
+                    leader_target = targets[li]
                     # Also consider the leader's actual speed — if it is
                     # physically much slower than its target (e.g. just
                     # stopped by cross-guard or waiting at a sign), the
                     # follower must match the real speed, not the wish.
                     effective_leader = min(leader_target, leader.speed)
-                    follower_current = targets.get(follower.id, follower.cruise_speed)
+                    follower_current = targets[fi]
 
                     if gap < safe * 0.8:
                         new_target = 0.0
@@ -1125,7 +1323,7 @@ class World:
                         reason = "gap<1.5*safe MATCH"
 
                     if new_target < follower_current:
-                        targets[follower.id] = new_target
+                        targets[fi] = new_target
                         interventions += 1
                         if tick % 10 == 1:
                             log.debug(
@@ -1137,6 +1335,144 @@ class World:
                             )
         return interventions
 
+    def _guard_candidate_pairs(
+        self,
+        targets: List[float],
+        dt: float,
+    ) -> List[Tuple[int, int]]:
+        """Return ``(i, j)`` index pairs (``i < j``, row-major) that may
+        need the cross guard.
+
+        A broadcast over every pair gives a conservative superset of
+        :meth:`_pair_needs_guard`: pairs whose current distance exceeds
+        the safe distance plus everything both cars could cover within
+        the horizon cannot conflict, and the stop-line ETA test does not
+        depend on distance at all.  Targets only ever decrease inside
+        the guard, so the superset stays valid across all guard passes;
+        callers must re-screen after moving a car.  Worlds with fewer than
+        ``_VECTOR_MIN_CARS`` cars skip the screen and get every pair.
+        """
+        cars = self.cars
+        n = len(cars)
+        if n < _VECTOR_MIN_CARS:
+            # Skip pairs where both cars already passed the intersection.
+            return [
+                (i, j)
+                for i in range(n)
+                for j in range(i + 1, n)
+                if not (cars[i].passed and cars[j].passed)
+            ]
+        state = self._car_state()
+        policy = self.policy
+        v = np.maximum(0.0, np.array(targets, dtype=np.float64)) * KMH_TO_MPS
+        horizon = max(dt, policy.horizon_s)
+
+        # Pairs where both cars already passed the intersection are
+        # skipped, so only rows for cars still approaching are built.
+        act = np.flatnonzero(~state.passed)
+        if act.size == 0:
+            return []
+
+        dx = state.x[act, None] - state.x[None, :]
+        dy = state.y[act, None] - state.y[None, :]
+        safe = pair_safe_distance_array(state.speed[act, None], state.speed[None, :], policy)
+        bound = safe + (v[act, None] + v[None, :]) * horizon + 1e-9
+        near = dx * dx + dy * dy <= bound * bound
+
+        # Perpendicular approaches that both reach the same stop line soon.
+        line = state.distance_to_line(policy.stop_line_offset_m)
+        fast = v > 0.5
+        eta = np.where(fast, line / np.where(fast, v, 1.0), 999.0)
+        ready = ~state.passed & (line >= 0.0) & (eta < max(2.5, horizon))
+        int_idx, has_sem = self._intersection_codes()
+        horizontal = state.vx != 0
+        zone = (
+            (int_idx[act, None] == int_idx[None, :])
+            & ~(has_sem[act, None] & has_sem[None, :])
+            & (horizontal[act, None] != horizontal[None, :])
+            & ready[act, None] & ready[None, :]
+        )
+
+        cand = np.zeros((n, n), dtype=np.bool_)
+        cand[act] = near | zone
+        cand |= cand.T
+        rows, cols = np.nonzero(np.triu(cand, 1))
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def _intersection_codes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-car intersection index (``-1`` if unknown) and semaphore flag."""
+        n = len(self.cars)
+        int_idx = np.fromiter(
+            (self._int_index.get(c.current_int_id, -1) for c in self.cars),
+            np.int16, n,
+        )
+        has_sem = np.fromiter(
+            (self._int_has_sem.get(c.current_int_id, False) for c in self.cars),
+            np.bool_, n,
+        )
+        return int_idx, has_sem
+
+    def _guard_pair_mask(
+        self,
+        pairs: List[Tuple[int, int]],
+        targets: List[float],
+        dt: float,
+    ) -> List[bool]:
+        """Vectorised :meth:`_pair_needs_guard` over *pairs* for the
+        current *targets*.
+
+        Mirrors the scalar predicate step by step, with a small slack on
+        every distance comparison so the mask is a superset of it: a
+        ``False`` entry is authoritative only while neither car's target
+        has changed.
+        """
+        if len(pairs) < _GUARD_MASK_MIN_PAIRS or len(self.cars) < _VECTOR_MIN_CARS:
+            # Too few pairs or cars to amortise the array set-up.
+            return [True] * len(pairs)
+        state = self._car_state()
+        policy = self.policy
+        tol = 1e-9
+        ii, jj = np.array(pairs, dtype=np.intp).T
+        v = np.maximum(0.0, np.array(targets, dtype=np.float64)) * KMH_TO_MPS
+        horizon = max(dt, policy.horizon_s)
+
+        x, y, vx, vy = state.x, state.y, state.vx, state.vy
+        ax, ay, avx, avy, va = x[ii], y[ii], vx[ii], vy[ii], v[ii]
+        bx, by, bvx, bvy, vb = x[jj], y[jj], vx[jj], vy[jj], v[jj]
+        safe = pair_safe_distance_array(state.speed[ii], state.speed[jj], policy)
+        safe_sq = (safe + tol) ** 2
+        now_sq = (ax - bx) ** 2 + (ay - by) ** 2
+
+        int_idx, has_sem = self._intersection_codes()
+        same_int = int_idx[ii] == int_idx[jj]
+        same_dir = (avx == bvx) & (avy == bvy)
+        excluded = ~same_int & (~same_dir | (now_sq > (50.0 + tol) ** 2))
+        perpendicular = (avx != 0) != (bvx != 0)
+        both_sem = has_sem[ii] & has_sem[jj]
+
+        # Time-swept projection.
+        swept = np.zeros(len(pairs), dtype=np.bool_)
+        step_dt = horizon / 4
+        for k in range(1, 5):
+            t = step_dt * k
+            sx = (ax + avx * va * t) - (bx + bvx * vb * t)
+            sy = (ay + avy * va * t) - (by + bvy * vb * t)
+            swept |= sx * sx + sy * sy <= safe_sq
+        swept &= ~(perpendicular & both_sem)
+
+        # Intersection-zone conflict for perpendicular approaches.
+        line = state.distance_to_line(policy.stop_line_offset_m)
+        da, db = line[ii], line[jj]
+        eta_a = np.where(va > 0.5, da / np.where(va > 0.5, va, 1.0), 999.0)
+        eta_b = np.where(vb > 0.5, db / np.where(vb > 0.5, vb, 1.0), 999.0)
+        window = max(2.5, horizon)
+        zone = (
+            same_int & ~(state.passed[ii] | state.passed[jj]) & ~both_sem
+            & perpendicular & (da >= -tol) & (db >= -tol)
+            & (eta_a < window) & (eta_b < window)
+        )
+        return ((now_sq <= safe_sq) | (~excluded & (swept | zone))).tolist()
+
     @staticmethod
     def _following_gap(leader: Car, follower: Car) -> float:
         """Axial distance between two same-direction cars."""
@@ -1148,12 +1484,16 @@ class World:
         self,
         a: Car,
         b: Car,
-        targets: Dict[str, float],
+        target_a: float,
+        target_b: float,
         dt: float,
     ) -> bool:
-        safe_dist = pair_safe_distance_m(a, b, self.policy)
-        now = math.hypot(a.x - b.x, a.y - b.y)
-        if now <= safe_dist:
+        safe_dist = self._pair_safe(a, b)
+        safe_sq = safe_dist * safe_dist
+        dx = a.x - b.x
+        dy = a.y - b.y
+        now_sq = dx * dx + dy * dy
+        if now_sq <= safe_sq:
             return True
 
         # ── Skip cross-intersection projection for distant cars ──────
@@ -1168,7 +1508,7 @@ class World:
             # Different intersections, different directions → no conflict
             # unless they're already very close (covered by check above).
             return False
-        if not same_int and same_direction and now > 50.0:
+        if not same_int and same_direction and now_sq > 2500.0:   # > 50 m
             # Same direction (possibly connecting road) but far apart.
             return False
 
@@ -1185,8 +1525,8 @@ class World:
         b_node = self.network.intersections.get(b.current_int_id)
         both_sem = (a_node and a_node.has_semaphore) and (b_node and b_node.has_semaphore)
         if not (perpendicular and both_sem):
-            va = max(0.0, targets.get(a.id, a.speed)) / 3.6
-            vb = max(0.0, targets.get(b.id, b.speed)) / 3.6
+            va = max(0.0, target_a) * KMH_TO_MPS
+            vb = max(0.0, target_b) * KMH_TO_MPS
             horizon = max(dt, self.policy.horizon_s)
             steps = 4
             step_dt = horizon / steps
@@ -1196,7 +1536,7 @@ class World:
                 ay = a.y + a.vy * va * t
                 bx = b.x + b.vx * vb * t
                 by = b.y + b.vy * vb * t
-                if math.hypot(ax - bx, ay - by) <= safe_dist:
+                if (ax - bx) ** 2 + (ay - by) ** 2 <= safe_sq:
                     return True
 
         # ── Intersection-zone conflict for perpendicular approaches ──
@@ -1225,7 +1565,7 @@ class World:
 
     @staticmethod
     def _project(car: Car, speed_kmh: float, dt: float) -> Tuple[float, float]:
-        speed_mps = max(0.0, speed_kmh) / 3.6
+        speed_mps = max(0.0, speed_kmh) * KMH_TO_MPS
         return (
             car.x + car.vx * speed_mps * dt,
             car.y + car.vy * speed_mps * dt,
@@ -1290,8 +1630,8 @@ class World:
                 return b
 
         # Priority scheduler: lower-priority car yields.
-        pa = danger_score(a, self.policy)
-        pb = danger_score(b, self.policy)
+        pa = self._danger_of(a)
+        pb = self._danger_of(b)
         if abs(pa - pb) > 0.1:
             return a if pa < pb else b
 
@@ -1398,31 +1738,57 @@ class World:
         if self._is_emergency(car):
             return False
         cx, cy = self._int_center(car)
-        dist = math.hypot(car.x - cx, car.y - cy)
-        if dist > self.policy.signal_control_radius_m:
+        dx = car.x - cx
+        dy = car.y - cy
+        radius = self.policy.signal_control_radius_m
+        if dx * dx + dy * dy > radius * radius:
             return False
         return car.approach != self.green_approach
 
     def _is_emergency(self, car: Car) -> bool:
         # Treat both representations as emergency to avoid one-tick
         # desyncs between role and priority flag.
-        return bool(car.priority) or self._is_emergency_role(car.role)
+        if car.priority:
+            return True
+        return self._is_emergency_role(car.role)
+
+    def _danger_scores(self) -> np.ndarray:
+        """Danger score of every car, filling the per-tick cache if open."""
+        state = self._car_state()
+        scores = state.danger_scores(self.policy)
+        if self._tick_danger is not None:
+            self._tick_danger = dict(
+                zip((car.id for car in self.cars), scores.tolist())
+            )
+        return scores
+
+    def _danger_of(self, car: Car) -> float:
+        """Cached :func:`danger_score` for *car* within the current tick."""
+        cache = self._tick_danger
+        if cache is None:
+            return danger_score(car, self.policy)
+        if not cache:
+            self._danger_scores()
+            cache = self._tick_danger
+        score = cache.get(car.id)
+        return danger_score(car, self.policy) if score is None else score
 
     def _update_virtual_signal(self, dt: float) -> None:
         self._green_ttl_s = max(0.0, self._green_ttl_s - dt)
         approach_scores: Dict[str, float] = {a: 0.0 for a in _APPROACHES}
 
-        for car in self.cars:
-            if car.passed:
-                continue
-            cx, cy = self._int_center(car)
-            dist = math.hypot(car.x - cx, car.y - cy)
-            if dist > self.policy.signal_control_radius_m:
-                continue
-            score = danger_score(car, self.policy)
-            if self._is_emergency(car):
-                score += 3.0
-            approach_scores[car.approach] += score
+        if self.cars:
+            scores = self._danger_scores()
+            state = self._state
+            scores = scores + 3.0 * state.emergency()
+            dx = state.x - state.cx
+            dy = state.y - state.cy
+            radius = self.policy.signal_control_radius_m
+            active = ~state.passed & (dx * dx + dy * dy <= radius * radius)
+            totals = np.bincount(
+                state.approach_idx[active], weights=scores[active], minlength=4,
+            )
+            approach_scores.update(zip(APPROACHES, totals.tolist()))
 
         best_approach = max(approach_scores, key=approach_scores.get)
         best_score = approach_scores[best_approach]
@@ -1466,62 +1832,109 @@ class World:
     def _resolve_overlaps(self) -> int:
         """
         Last-resort overlap resolver to prevent cars rendering inside each other.
+
+        From ``_OVERLAP_MATRIX_MIN_CARS`` cars up, overlapping pairs are found
+        with one broadcast distance matrix; only those pairs are visited,
+        in the original row-major order.  After a push the two moved
+        cars' rows are refreshed so pairs that start overlapping mid-pass
+        are still picked up.  Smaller worlds check every pair directly.
         """
         count = 0
-        tick = self._tick_count
-        n = len(self.cars)
+        cars = self.cars
+        n = len(cars)
+        if n < 2:
+            return count
         # Use a fixed hard radius for overlap detection so speed changes
         # don't create a feedback loop (pair_safe_distance_m shrinks when
         # we cap speed, causing repeated triggers).
         hard_radius = self.policy.min_pair_distance_m
+        if n < _OVERLAP_MATRIX_MIN_CARS:
+            for _ in range(3):
+                changed = False
+                for i in range(n):
+                    a = cars[i]
+                    for j in range(i + 1, n):
+                        b = cars[j]
+                        dist = math.hypot(a.x - b.x, a.y - b.y)
+                        if dist >= hard_radius:
+                            continue
+                        count += 1
+                        changed = True
+                        self._push_apart(a, b, dist, hard_radius)
+                if not changed:
+                    break
+            return count
+
+        limit = hard_radius + 1e-9
+        limit_sq = limit * limit
         for _ in range(3):
             changed = False
-            for i in range(n):
-                a = self.cars[i]
-                for j in range(i + 1, n):
-                    b = self.cars[j]
-                    dx = a.x - b.x
-                    dy = a.y - b.y
-                    dist = math.hypot(dx, dy)
-                    if dist >= hard_radius:
-                        continue
-
-                    count += 1
-                    changed = True
-
-                    a_spd_before = a.speed
-                    b_spd_before = b.speed
-
-                    if dist < 1e-6:
-                        b.x += 0.5
-                        b.y += 0.5
-                    else:
-                        overlap = (hard_radius - dist) / 2.0
-                        ux, uy = dx / dist, dy / dist
-                        a.x += ux * overlap
-                        a.y += uy * overlap
-                        b.x -= ux * overlap
-                        b.y -= uy * overlap
-
-                    # Only slow the faster car instead of capping both.
-                    if a.speed > b.speed:
-                        a.speed = min(a.speed, max(b.speed, 3.0))
-                    else:
-                        b.speed = min(b.speed, max(a.speed, 3.0))
-
-                    if tick % 10 == 1:
-                        log.debug(
-                            "  OVERLAP: %s & %s  dist=%.1f hard_r=%.1f  "
-                            "nudge=%.2f  %s spd %.1f->%.1f  %s spd %.1f->%.1f",
-                            a.id, b.id, dist, hard_radius,
-                            (hard_radius - dist) / 2.0,
-                            a.id, a_spd_before, a.speed,
-                            b.id, b_spd_before, b.speed,
-                        )
+            xs = np.fromiter((c.x for c in cars), np.float64, n)
+            ys = np.fromiter((c.y for c in cars), np.float64, n)
+            close = (xs[:, None] - xs) ** 2 + (ys[:, None] - ys) ** 2 < limit_sq
+            rows, cols = np.nonzero(np.triu(close, 1))
+            hits = list(zip(rows.tolist(), cols.tolist()))
+            k = 0
+            while k < len(hits):
+                i, j = hits[k]
+                k += 1
+                a = cars[i]
+                b = cars[j]
+                # Pushed pairs settle exactly at ``hard_radius``, so this
+                # test stays on hypot to keep the boundary rounding stable.
+                dist = math.hypot(a.x - b.x, a.y - b.y)
+                if dist >= hard_radius:
+                    continue
+
+                count += 1
+                changed = True
+                self._push_apart(a, b, dist, hard_radius)
+
+                # Both cars moved — refresh their rows and re-scan ahead.
+                for idx, car in ((i, a), (j, b)):
+                    xs[idx] = car.x
+                    ys[idx] = car.y
+                    row = (xs - xs[idx]) ** 2 + (ys - ys[idx]) ** 2 < limit_sq
+                    close[idx, :] = row
+                    close[:, idx] = row
+                rows, cols = np.nonzero(np.triu(close, 1))
+                hits = [p for p in zip(rows.tolist(), cols.tolist()) if p > (i, j)]
+                k = 0
             if not changed:
                 break
         return count
 
+    def _push_apart(self, a: Car, b: Car, dist: float, hard_radius: float) -> None:
+        """Push an overlapping pair *dist* apart out to *hard_radius*."""
+        a_spd_before = a.speed
+        b_spd_before = b.speed
+
+        if dist < 1e-6:
+            b.x += 0.5
+            b.y += 0.5
+        else:
+            overlap = (hard_radius - dist) / 2.0
+            ux, uy = (a.x - b.x) / dist, (a.y - b.y) / dist
+            a.x += ux * overlap
+            a.y += uy * overlap
+            b.x -= ux * overlap
+            b.y -= uy * overlap
+
+        # Only slow the faster car instead of capping both.
+        if a.speed > b.speed:
+            a.speed = min(a.speed, max(b.speed, 3.0))
+        else:
+            b.speed = min(b.speed, max(a.speed, 3.0))
+
+        if self._tick_count % 10 == 1:
+            log.debug(
+                "  OVERLAP: %s & %s  dist=%.1f hard_r=%.1f  "
+                "nudge=%.2f  %s spd %.1f->%.1f  %s spd %.1f->%.1f",
+                a.id, b.id, dist, hard_radius,
+                (hard_radius - dist) / 2.0,
+                a.id, a_spd_before, a.speed,
+                b.id, b_spd_before, b.speed,
+            )
 
 if __name__ == "__main__":
     world = World()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+ui/bench_draw_map.py
+====================
+Frame-time benchmark for :func:`ui.draw_road.draw_map`.
+
+Times three camera patterns on a headless display:
+
+* **pan**   — the camera moves every frame (every frame is a new view);
+* **still** — the camera holds one view (served from the static cache);
+* **plain** — every layer drawn in place each frame with no cache, which
+  is what ``draw_map`` did before the static layers were cached.
+
+Panning should cost no more than *plain*; a still camera should be far
+cheaper.
+
+Run from the project root:
+    python -m ui.bench_draw_map [--width 1280] [--height 800] [--zoom 1.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Any, Callable, Dict
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from sim.sim_bridge import SimBridge
+from ui import draw_road
+from ui.types import Camera
+
+
+def _best_frame_ms(draw: Callable[[int], None], frames: int, repeats: int) -> float:
+    """Fastest mean frame time (ms) of *repeats* runs of *frames* frames."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for k in range(frames):
+            draw(k)
+        best = min(best, (time.perf_counter() - start) / frames)
+    return best * 1e3
+
+
+def run(width: int, height: int, zoom: float, frames: int = 40,
+        repeats: int = 7, seed: int = 3) -> Dict[str, float]:
+    """Return the best mean frame time (ms) of each camera pattern."""
+    pygame.init()
+    screen = pygame.display.set_mode((width, height))
+    bridge = SimBridge(vehicle_count=5, random_seed=seed)
+    bridge._tick(0.05)  # one step publishes the map metadata
+    intersection: Dict[str, Any] = bridge.get_intersection()
+    (x0, x1), (y0, y1) = bridge.get_network_bounds(width, height)
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+
+    def camera(k: int) -> Camera:
+        return Camera(width, height, world_x=cx + k * 0.37, world_y=cy, zoom=zoom)
+
+    def plain(k: int) -> None:
+        draw_road._map_cache.clear()
+        draw_road._map_last_key = None
+        draw_road.draw_map(screen, camera(k), intersection)
+
+    return {
+        "pan": _best_frame_ms(
+            lambda k: draw_road.draw_map(screen, camera(k), intersection),
+            frames, repeats),
+        "still": _best_frame_ms(
+            lambda k: draw_road.draw_map(screen, camera(0), intersection),
+            frames, repeats),
+        "plain": _best_frame_ms(plain, frames, repeats),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=800)
+    parser.add_argument("--zoom", type=float, default=1.0)
+    parser.add_argument("--frames", type=int, default=40)
+    args = parser.parse_args()
+    times = run(args.width, args.height, args.zoom, args.frames)
+    for name, ms in times.items():
+        print(f"{name:>5}: {ms:6.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
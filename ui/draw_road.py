@@ -6,13 +6,20 @@ Renders the Google-Maps-style 2D map for a multi-intersection road network:
   intersection boxes, traffic signs/semaphores, and decorative elements.
 
 All functions are *pure renderers* — they read data and draw to a surface.
+The static layers of a view that holds still are rendered once and
+re-blitted (see :func:`draw_map`); signs and semaphores are blitted from
+cached sprites.
 """
 
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List, Set, Tuple
+import random
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
+import numpy as np
 import pygame
 
 from ui.constants import (
@@ -31,11 +38,27 @@ from ui.constants import (
     DASH_LEN, DASH_GAP,
 )
 from ui.types import Camera
-from ui.helpers import draw_alpha_rect, draw_alpha_circle
+from ui.helpers import draw_alpha_rect
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 _DEFAULT_TERMINAL_ARM_LEN = 300.0  # default for terminal road arms (m)
 _APPROACHES = ("N", "S", "E", "W")
+_MAP_CACHE_SIZE = 4                # rendered static layers kept (LRU)
+
+# Last (network key, arm lengths) pair computed by _arm_lengths
+_arms_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Dict[str, float]]]] = None
+_net_arrays_cache: Optional[Tuple[Tuple[Any, ...], "_NetworkArrays"]] = None
+
+# Sign, semaphore and decoration sprites, keyed on the integer sizes
+# derived from zoom
+_Sprite = Tuple[pygame.Surface, Tuple[int, int]]   # (surface, anchor pixel)
+_Blit = Tuple[pygame.Surface, Tuple[int, int]]     # (surface, screen dest)
+_sign_cache: Dict[Tuple[Any, ...], _Sprite] = {}
+_light_cache: Dict[Tuple[Any, ...], _Sprite] = {}
+_sign_fonts: Dict[int, pygame.font.Font] = {}
+_tree_cache: Dict[Tuple[int, ...], _Sprite] = {}
+_house_cache: Dict[Tuple[Any, ...], pygame.Surface] = {}
+_dash_tiles: Dict[Tuple[int, int], pygame.Surface] = {}
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -96,7 +119,14 @@ def _arm_lengths(
     roads_data: List[Dict[str, Any]],
 ) -> Dict[str, Dict[str, float]]:
     """Per-intersection arm lengths.  Connected arms extend half the
-    distance to the neighbour; terminal arms extend dynamically."""
+    distance to the neighbour; terminal arms extend dynamically.
+
+    Memoised on :func:`_network_key`; treat the result as read-only.
+    """
+    global _arms_cache
+    key = _network_key(intersections, roads_data)
+    if _arms_cache is not None and _arms_cache[0] == key:
+        return _arms_cache[1]
     centers = {i["id"]: i["center"] for i in intersections}
     terminal_lens = _compute_terminal_lengths(intersections)
     result: Dict[str, Dict[str, float]] = {}
@@ -109,9 +139,46 @@ def _arm_lengths(
         half = dist / 2.0
         result[road["from_id"]][road["from_arm"]] = half
         result[road["to_id"]][road["to_arm"]] = half
+    _arms_cache = (key, result)
     return result
 
 
+class _NetworkArrays(NamedTuple):
+    """Intersection centres and arm lengths as parallel ``float64`` arrays."""
+
+    cx: np.ndarray
+    cy: np.ndarray
+    n: np.ndarray
+    s: np.ndarray
+    e: np.ndarray
+    w: np.ndarray
+
+    def subset(self, mask: np.ndarray) -> "_NetworkArrays":
+        return _NetworkArrays(*(a[mask] for a in self))
+
+
+def _network_arrays(
+    intersections: List[Dict[str, Any]],
+    roads_data: List[Dict[str, Any]],
+) -> _NetworkArrays:
+    """:func:`_arm_lengths` laid out as arrays, in *intersections* order.
+
+    Memoised on :func:`_network_key` like the arm lengths themselves.
+    """
+    global _net_arrays_cache
+    key = _network_key(intersections, roads_data)
+    if _net_arrays_cache is not None and _net_arrays_cache[0] == key:
+        return _net_arrays_cache[1]
+    arms = _arm_lengths(intersections, roads_data)
+    cols = [
+        (*i["center"], *(arms[i["id"]][a] for a in _APPROACHES))
+        for i in intersections
+    ]
+    net = _NetworkArrays(*np.array(cols, dtype=np.float64).reshape(-1, 6).T)
+    _net_arrays_cache = (key, net)
+    return net
+
+
 def _connected_set(
     roads_data: List[Dict[str, Any]],
 ) -> Dict[str, Set[str]]:
@@ -127,60 +194,153 @@ def _connected_set(
 #  PUBLIC  draw_map()  — single entry point
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Static layers (grass → decorations) rendered once per camera / network
+# and blitted on later frames; only signs and semaphores are redrawn.
+# A view is cached only once it is drawn twice in a row, so panning and
+# zooming draw straight to the screen instead of filling the cache.
+class _StaticMap(NamedTuple):
+    """Everything :func:`draw_map` derives from one camera / network state."""
+
+    surface: pygame.Surface                      # grass → decorations
+    sign_shown: List[bool]                       # per intersection
+    sign_anchors: List[Dict[str, Tuple[int, int]]]
+
+
+_map_cache: "OrderedDict[Tuple[Any, ...], _StaticMap]" = OrderedDict()
+_map_last_key: Optional[Tuple[Any, ...]] = None   # view drawn last frame
+
+
 def draw_map(
     screen: pygame.Surface,
     camera: Camera,
     intersection: Dict[str, Any],
 ) -> None:
     """Draw the complete multi-intersection map background in z-order."""
+    global _map_last_key
     intersections = intersection.get("intersections", [])
     roads_data = intersection.get("roads", [])
+
+    key = _static_key(screen, camera, intersections, roads_data)
+    static = _map_cache.get(key)
+    if static is not None:
+        _map_cache.move_to_end(key)
+        screen.blit(static.surface, (0, 0))
+        sign_shown, sign_anchors = static.sign_shown, static.sign_anchors
+    elif key != _map_last_key:
+        # The view is changing: draw in place rather than cache a frame
+        # that is unlikely to be shown again.
+        _draw_static_layers(screen, camera, intersections, roads_data)
+        net = _network_arrays(intersections, roads_data)
+        sign_shown, sign_anchors = _sign_anchors(screen, camera, net)
+    else:
+        surface = None
+        if len(_map_cache) >= _MAP_CACHE_SIZE:
+            # Recycle the evicted surface when it still fits the screen.
+            old = _map_cache.popitem(last=False)[1].surface
+            if (old.get_size() == screen.get_size()
+                    and old.get_bitsize() == screen.get_bitsize()):
+                surface = old
+        if surface is None:
+            surface = pygame.Surface(screen.get_size(), 0, screen)
+        _draw_static_layers(surface, camera, intersections, roads_data)
+        net = _network_arrays(intersections, roads_data)
+        static = _StaticMap(surface, *_sign_anchors(screen, camera, net))
+        _map_cache[key] = static
+        screen.blit(surface, (0, 0))
+        sign_shown, sign_anchors = static.sign_shown, static.sign_anchors
+    _map_last_key = key
+
+    # Signs / semaphores per intersection (skipping off-screen ones),
+    # submitted as one batched blit
+    blits: List[_Blit] = []
+    for info, on_screen, spots in zip(intersections, sign_shown, sign_anchors):
+        if not on_screen:
+            continue
+        sem = info.get("semaphore", {})
+        if sem.get("enabled", False):
+            _semaphore_blits(camera, sem, spots, blits)
+        else:
+            _sign_blits(camera, info, spots, blits)
+    screen.blits(blits, doreturn=False)
+
+
+def _static_key(
+    screen: pygame.Surface,
+    camera: Camera,
+    intersections: List[Dict[str, Any]],
+    roads_data: List[Dict[str, Any]],
+) -> Tuple[Any, ...]:
+    """Everything the static layers depend on: viewport and geometry."""
+    return (
+        screen.get_size(),
+        camera.screen_w, camera.screen_h,
+        camera.world_x, camera.world_y, camera.zoom,
+        _network_key(intersections, roads_data),
+    )
+
+
+def _network_key(
+    intersections: List[Dict[str, Any]],
+    roads_data: List[Dict[str, Any]],
+) -> Tuple[Any, ...]:
+    """Hashable summary of the road geometry (ids, centres, road links)."""
+    return (
+        tuple((i["id"], tuple(i["center"])) for i in intersections),
+        tuple((r["from_id"], r["from_arm"], r["to_id"], r["to_arm"])
+              for r in roads_data),
+    )
+
+
+def _draw_static_layers(
+    screen: pygame.Surface,
+    camera: Camera,
+    intersections: List[Dict[str, Any]],
+    roads_data: List[Dict[str, Any]],
+) -> None:
+    """Draw every layer below the signs — nothing here changes per tick."""
     arms = _arm_lengths(intersections, roads_data)
+    net = _network_arrays(intersections, roads_data)
 
     _draw_grass(screen, camera)
 
-    # Road shadows
-    for info in intersections:
-        cx, cy = info["center"]
-        _draw_road_shadows_at(screen, camera, cx, cy, arms[info["id"]])
+    # Only intersections whose arms reach into the viewport
+    shown = _visible_mask(screen, camera, net)
+    visible = [info for info, v in zip(intersections, shown.tolist()) if v]
 
-    # Road surfaces
-    for info in intersections:
-        cx, cy = info["center"]
-        _draw_road_surfaces_at(screen, camera, cx, cy, arms[info["id"]])
+    net = net.subset(shown)
 
-    # Sidewalks
-    for info in intersections:
-        cx, cy = info["center"]
-        _draw_sidewalks_at(screen, camera, cx, cy, arms[info["id"]])
+    # Road shadows, road surfaces, sidewalks — one flat rect array per layer
+    # (clipped to the screen, so Surface.fill's fast path can take them)
+    for color, rects in _layer_rects(camera, net):
+        for r in _clip_to_view(screen, rects).tolist():
+            screen.fill(color, r)
 
     # Intersection boxes
-    for info in intersections:
-        cx, cy = info["center"]
-        _draw_intersection_box_at(screen, camera, cx, cy)
+    boxes = _intersection_box_rects(camera, net)
+    for r in boxes[_touches_view(screen, boxes, 8)].tolist():
+        _draw_intersection_box(screen, *r)
 
-    # Lane markings
-    for info in intersections:
+    # Lane dashes vary in count per arm, so they are gathered per intersection
+    dashes: List[Tuple[int, int, int, int]] = []
+    for info in visible:
         cx, cy = info["center"]
-        _draw_lane_markings_at(screen, camera, cx, cy, arms[info["id"]])
+        dashes.extend(_lane_dash_rects(camera, cx, cy, arms[info["id"]]))
+
+    # Lane markings, blitted from solid tiles in one batch
+    sw, sh = screen.get_size()
+    screen.blits([(_dash_tile(screen, w, h), (x, y)) for x, y, w, h in dashes
+                  if x < sw and y < sh and x + w > 0 and y + h > 0],
+                 doreturn=False)
 
     # Edge lines
-    for info in intersections:
-        cx, cy = info["center"]
-        _draw_edge_lines_at(screen, camera, cx, cy, arms[info["id"]])
+    thickness = max(1, int(camera.zoom * 0.4))
+    edge_pts = _edge_line_points(camera, net)
+    for p1, p2 in zip(edge_pts[::2], edge_pts[1::2]):
+        pygame.draw.line(screen, COLOR_ROAD_EDGE, p1, p2, thickness)
 
     # Decorations (generated per-intersection)
     _draw_decorations(screen, camera, intersections, roads_data)
 
-    # Signs / semaphores per intersection
-    for info in intersections:
-        cx, cy = info["center"]
-        sem = info.get("semaphore", {})
-        if sem.get("enabled", False):
-            _draw_semaphores(screen, camera, sem, cx, cy)
-        else:
-            _draw_signs(screen, camera, info, cx, cy)
-
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  PRIVATE helpers
@@ -188,167 +348,200 @@ def draw_map(
 
 def _world_rect(cam: Camera, x1: float, y1: float, x2: float, y2: float) -> pygame.Rect:
     """Convert two world-space corners to a screen-space Rect (y-flipped)."""
-    sx1, sy1 = cam.world_to_screen(min(x1, x2), max(y1, y2))
-    sx2, sy2 = cam.world_to_screen(max(x1, x2), min(y1, y2))
+    # Inlined Camera.world_to_screen for both corners; same float ops.
+    if x1 > x2:
+        x1, x2 = x2, x1
+    if y1 < y2:
+        y1, y2 = y2, y1
+    cx = cam.screen_w / 2
+    cy = cam.screen_h / 2
+    z = cam.zoom
+    sx1 = cx + (x1 - cam.world_x) * z
+    sx2 = cx + (x2 - cam.world_x) * z
+    sy1 = cy - (y1 - cam.world_y) * z
+    sy2 = cy - (y2 - cam.world_y) * z
     return pygame.Rect(int(sx1), int(sy1), max(1, int(sx2 - sx1)), max(1, int(sy2 - sy1)))
 
 
-# ── Grass ─────────────────────────────────────────────────────────────────────
+def _world_rects(
+    cam: Camera,
+    x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+) -> np.ndarray:
+    """Vectorised :func:`_world_rect`: one ``(x, y, w, h)`` row per corner pair."""
+    sx1, sy1 = cam.world_to_screen_array(np.minimum(x1, x2), np.maximum(y1, y2))
+    sx2, sy2 = cam.world_to_screen_array(np.maximum(x1, x2), np.minimum(y1, y2))
+    return np.stack((
+        sx1.astype(np.int64), sy1.astype(np.int64),
+        np.maximum(1, (sx2 - sx1).astype(np.int64)),
+        np.maximum(1, (sy2 - sy1).astype(np.int64)),
+    ), axis=1)
+
+
+def _visible_mask(
+    screen: pygame.Surface, cam: Camera, net: "_NetworkArrays",
+) -> np.ndarray:
+    """Intersections whose arms and sidewalks (padded by :func:`_screen_pad`)
+    overlap the viewport — ``Rect.inflate(...).colliderect(view)`` per row."""
+    side = ROAD_HALF_W + SIDEWALK_W
+    ext = _world_rects(cam,
+                       net.cx - np.maximum(net.w, side), net.cy - np.maximum(net.s, side),
+                       net.cx + np.maximum(net.e, side), net.cy + np.maximum(net.n, side))
+    return _touches_view(screen, ext, 2 * _screen_pad(cam))
+
+
+def _clip_to_view(screen: pygame.Surface, rects: np.ndarray) -> np.ndarray:
+    """Rows of *rects* clipped to the screen, dropping any left empty.
+
+    ``Surface.fill`` mis-clips rects with a negative origin (it fills
+    from 0 with the full width), so rects are clipped here first.
+    """
+    w, h = screen.get_size()
+    x0 = np.maximum(rects[:, 0], 0)
+    y0 = np.maximum(rects[:, 1], 0)
+    x1 = np.minimum(rects[:, 0] + rects[:, 2], w)
+    y1 = np.minimum(rects[:, 1] + rects[:, 3], h)
+    keep = (x1 > x0) & (y1 > y0)
+    return np.stack((x0, y0, x1 - x0, y1 - y0), axis=1)[keep]
 
-def _draw_grass(screen: pygame.Surface, cam: Camera) -> None:
-    screen.fill(COLOR_GRASS)
 
+def _touches_view(screen: pygame.Surface, rects: np.ndarray, pad: int) -> np.ndarray:
+    """``Rect(r).inflate(pad, pad).colliderect(screen.get_rect())`` per row."""
+    x = rects[:, 0] - pad // 2
+    y = rects[:, 1] - pad // 2
+    w, h = screen.get_size()
+    return (x < w) & (y < h) & (x + rects[:, 2] + pad > 0) & (y + rects[:, 3] + pad > 0)
 
-# ── Road shadows ──────────────────────────────────────────────────────────────
 
-def _draw_road_shadows_at(
-    screen: pygame.Surface, cam: Camera,
-    cx: float, cy: float, arm_len: Dict[str, float],
-) -> None:
-    off = max(2, int(1.5 * cam.zoom))
-    hw = ROAD_HALF_W
-    dark = COLOR_GRASS_DARK
-    # Horizontal shadow
-    r = _world_rect(cam, cx - arm_len["W"], cy - hw, cx + arm_len["E"], cy + hw)
-    r.move_ip(off, off)
-    pygame.draw.rect(screen, dark, r)
-    # Vertical shadow
-    r = _world_rect(cam, cx - hw, cy - arm_len["S"], cx + hw, cy + arm_len["N"])
-    r.move_ip(off, off)
-    pygame.draw.rect(screen, dark, r)
+def _screen_pad(cam: Camera) -> int:
+    """Pixels that shadows, line widths and sign/tree sprites can spill
+    past their world footprint; used to make culling conservative."""
+    return int(8 * cam.zoom) + 16
 
 
-# ── Road surfaces ────────────────────────────────────────────────────────────
+# ── Grass ─────────────────────────────────────────────────────────────────────
 
-def _draw_road_surfaces_at(
-    screen: pygame.Surface, cam: Camera,
-    cx: float, cy: float, arm_len: Dict[str, float],
-) -> None:
-    hw = ROAD_HALF_W
-    # Horizontal
-    pygame.draw.rect(screen, COLOR_ROAD,
-                     _world_rect(cam, cx - arm_len["W"], cy - hw,
-                                 cx + arm_len["E"], cy + hw))
-    # Vertical
-    pygame.draw.rect(screen, COLOR_ROAD,
-                     _world_rect(cam, cx - hw, cy - arm_len["S"],
-                                 cx + hw, cy + arm_len["N"]))
+def _draw_grass(screen: pygame.Surface, cam: Camera) -> None:
+    screen.fill(COLOR_GRASS)
 
 
-# ── Sidewalks ────────────────────────────────────────────────────────────────
+# ── Road shadows, surfaces and sidewalks ─────────────────────────────────────
 
-def _draw_sidewalks_at(
-    screen: pygame.Surface, cam: Camera,
-    cx: float, cy: float, arm_len: Dict[str, float],
-) -> None:
+def _layer_rects(
+    cam: Camera, net: "_NetworkArrays",
+) -> List[Tuple[Tuple[int, int, int], np.ndarray]]:
+    """Flat-colour rect layers for every intersection in *net*, bottom-up."""
     hw = ROAD_HALF_W
     sw = SIDEWALK_W
-    # Horizontal top & bottom
-    ew = arm_len["E"]
-    ww = arm_len["W"]
-    pygame.draw.rect(screen, COLOR_SIDEWALK,
-                     _world_rect(cam, cx - ww, cy + hw, cx + ew, cy + hw + sw))
-    pygame.draw.rect(screen, COLOR_SIDEWALK,
-                     _world_rect(cam, cx - ww, cy - hw - sw, cx + ew, cy - hw))
-    # Vertical left & right
-    nn = arm_len["N"]
-    ss = arm_len["S"]
-    pygame.draw.rect(screen, COLOR_SIDEWALK,
-                     _world_rect(cam, cx - hw - sw, cy - ss, cx - hw, cy + nn))
-    pygame.draw.rect(screen, COLOR_SIDEWALK,
-                     _world_rect(cam, cx + hw, cy - ss, cx + hw + sw, cy + nn))
+    cx, cy = net.cx, net.cy
+    roads = np.concatenate((
+        # Horizontal
+        _world_rects(cam, cx - net.w, cy - hw, cx + net.e, cy + hw),
+        # Vertical
+        _world_rects(cam, cx - hw, cy - net.s, cx + hw, cy + net.n),
+    ))
+    off = max(2, int(1.5 * cam.zoom))
+    shadows = roads + (off, off, 0, 0)
+    sidewalks = np.concatenate((
+        # Horizontal top & bottom
+        _world_rects(cam, cx - net.w, cy + hw, cx + net.e, cy + hw + sw),
+        _world_rects(cam, cx - net.w, cy - hw - sw, cx + net.e, cy - hw),
+        # Vertical left & right
+        _world_rects(cam, cx - hw - sw, cy - net.s, cx - hw, cy + net.n),
+        _world_rects(cam, cx + hw, cy - net.s, cx + hw + sw, cy + net.n),
+    ))
+    return [
+        (COLOR_GRASS_DARK, shadows),
+        (COLOR_ROAD, roads),
+        (COLOR_SIDEWALK, sidewalks),
+    ]
 
 
 # ── Intersection box ─────────────────────────────────────────────────────────
 
-def _draw_intersection_box_at(
-    screen: pygame.Surface, cam: Camera, cx: float, cy: float,
-) -> None:
+def _intersection_box_rects(cam: Camera, net: _NetworkArrays) -> np.ndarray:
     hw = ROAD_HALF_W
-    rect = _world_rect(cam, cx - hw, cy - hw, cx + hw, cy + hw)
-    shadow = rect.copy()
-    shadow.move_ip(3, 3)
-    draw_alpha_rect(screen, (0, 0, 0, 35), shadow)
-    pygame.draw.rect(screen, COLOR_INTERSECTION, rect)
+    return _world_rects(cam, net.cx - hw, net.cy - hw, net.cx + hw, net.cy + hw)
+
+
+def _draw_intersection_box(
+    screen: pygame.Surface, x: int, y: int, w: int, h: int,
+) -> None:
+    draw_alpha_rect(screen, (0, 0, 0, 35), pygame.Rect(x + 3, y + 3, w, h))
+    pygame.draw.rect(screen, COLOR_INTERSECTION, (x, y, w, h))
 
 
 # ── Lane markings ────────────────────────────────────────────────────────────
 
-def _draw_lane_markings_at(
-    screen: pygame.Surface, cam: Camera,
-    cx: float, cy: float, arm_len: Dict[str, float],
-) -> None:
+def _lane_dash_rects(
+    cam: Camera, cx: float, cy: float, arm_len: Dict[str, float],
+) -> List[Tuple[int, int, int, int]]:
     hw = ROAD_HALF_W
     dl = DASH_LEN
-    dg = DASH_GAP
-    period = dl + dg
-
-    # West arm (horizontal dashes)
-    x = cx - arm_len["W"]
-    while x < cx - hw:
-        x1s, y1s = cam.world_to_screen(x, cy)
-        x2s, _ = cam.world_to_screen(min(x + dl, cx - hw), cy)
-        w = max(1, int(x2s - x1s))
-        h = max(1, int(2 * cam.zoom / 3))
-        pygame.draw.rect(screen, COLOR_LANE_WHITE,
-                         (int(x1s), int(y1s) - h // 2, w, h))
-        x += period
-
-    # East arm
-    x = cx + hw
-    while x < cx + arm_len["E"]:
-        x1s, y1s = cam.world_to_screen(x, cy)
-        x2s, _ = cam.world_to_screen(min(x + dl, cx + arm_len["E"]), cy)
-        w = max(1, int(x2s - x1s))
-        h = max(1, int(2 * cam.zoom / 3))
-        pygame.draw.rect(screen, COLOR_LANE_WHITE,
-                         (int(x1s), int(y1s) - h // 2, w, h))
-        x += period
-
-    # South arm (vertical dashes)
-    y = cy - arm_len["S"]
-    while y < cy - hw:
-        x1s, y1s = cam.world_to_screen(cx, y + dl)
-        _, y2s = cam.world_to_screen(cx, y)
-        w = max(1, int(2 * cam.zoom / 3))
-        hh = max(1, int(y2s - y1s))
-        pygame.draw.rect(screen, COLOR_LANE_WHITE,
-                         (int(x1s) - w // 2, int(y1s), w, hh))
-        y += period
-
-    # North arm
-    y = cy + hw
-    while y < cy + arm_len["N"]:
-        x1s, y1s = cam.world_to_screen(cx, y + dl)
-        _, y2s = cam.world_to_screen(cx, y)
-        w = max(1, int(2 * cam.zoom / 3))
-        hh = max(1, int(y2s - y1s))
-        pygame.draw.rect(screen, COLOR_LANE_WHITE,
-                         (int(x1s) - w // 2, int(y1s), w, hh))
-        y += period
+    period = dl + DASH_GAP
+    thick = max(1, int(2 * cam.zoom / 3))
+    rects: List[Tuple[int, int, int, int]] = []
+
+    # West / East arms (horizontal dashes, clipped at the arm end)
+    _, y1s = cam.world_to_screen(cx, cy)
+    top = int(y1s) - thick // 2
+    for x0, x_end in ((cx - arm_len["W"], cx - hw), (cx + hw, cx + arm_len["E"])):
+        xs = _dash_starts(x0, x_end, period)
+        x1s, _ = cam.world_to_screen_array(xs, cy)
+        x2s, _ = cam.world_to_screen_array(np.minimum(xs + dl, x_end), cy)
+        widths = np.maximum(1, (x2s - x1s).astype(np.int64))
+        rects.extend((x, top, w, thick)
+                     for x, w in zip(x1s.astype(np.int64).tolist(), widths.tolist()))
+
+    # South / North arms (vertical dashes)
+    x1s, _ = cam.world_to_screen(cx, cy)
+    left = int(x1s) - thick // 2
+    for y0, y_end in ((cy - arm_len["S"], cy - hw), (cy + hw, cy + arm_len["N"])):
+        ys = _dash_starts(y0, y_end, period)
+        _, y1s = cam.world_to_screen_array(cx, ys + dl)
+        _, y2s = cam.world_to_screen_array(cx, ys)
+        heights = np.maximum(1, (y2s - y1s).astype(np.int64))
+        rects.extend((left, y, thick, h)
+                     for y, h in zip(y1s.astype(np.int64).tolist(), heights.tolist()))
+    return rects
+
+
+def _dash_tile(screen: pygame.Surface, w: int, h: int) -> pygame.Surface:
+    """Solid lane-marking tile of ``w × h`` pixels in *screen*'s format."""
+    tile = _dash_tiles.get((w, h))
+    if tile is None:
+        tile = _dash_tiles[(w, h)] = pygame.Surface((w, h), 0, screen)
+        tile.fill(COLOR_LANE_WHITE)
+    return tile
+
+
+def _dash_starts(start: float, stop: float, period: float) -> np.ndarray:
+    """Dash start offsets ``start, start + period, …`` below *stop*.
+
+    ``cumsum`` adds sequentially, so the values match stepping a scalar
+    ``x += period`` loop bit for bit.
+    """
+    if start >= stop:
+        return np.empty(0)
+    steps = np.full(int((stop - start) // period) + 2, period)
+    steps[0] = start
+    xs = np.cumsum(steps)
+    return xs[xs < stop]
 
 
 # ── Road edge lines ──────────────────────────────────────────────────────────
 
-def _draw_edge_lines_at(
-    screen: pygame.Surface, cam: Camera,
-    cx: float, cy: float, arm_len: Dict[str, float],
-) -> None:
+def _edge_line_points(cam: Camera, net: _NetworkArrays) -> List[List[int]]:
+    """Screen endpoints of every intersection's four edge lines, as
+    consecutive pairs."""
     hw = ROAD_HALF_W
-    thickness = max(1, int(cam.zoom * 0.4))
-
-    edges = [
-        # Horizontal road top & bottom edges
-        (cx - arm_len["W"], cy + hw, cx + arm_len["E"], cy + hw),
-        (cx - arm_len["W"], cy - hw, cx + arm_len["E"], cy - hw),
-        # Vertical road left & right edges
-        (cx + hw, cy - arm_len["S"], cx + hw, cy + arm_len["N"]),
-        (cx - hw, cy - arm_len["S"], cx - hw, cy + arm_len["N"]),
-    ]
-    for wx1, wy1, wx2, wy2 in edges:
-        p1 = cam.world_to_screen(wx1, wy1)
-        p2 = cam.world_to_screen(wx2, wy2)
-        pygame.draw.line(screen, COLOR_ROAD_EDGE, _i2(p1), _i2(p2), thickness)
+    cx, cy = net.cx, net.cy
+    x1, x2 = cx - net.w, cx + net.e
+    y1, y2 = cy - net.s, cy + net.n
+    # Endpoint pairs: horizontal top & bottom, then vertical right & left
+    wx = np.stack((x1, x2, x1, x2, cx + hw, cx + hw, cx - hw, cx - hw), axis=1)
+    wy = np.stack((cy + hw, cy + hw, cy - hw, cy - hw, y1, y2, y1, y2), axis=1)
+    sx, sy = cam.world_to_screen_array(wx, wy)
+    return np.stack((sx, sy), axis=-1).reshape(-1, 2).astype(np.int64).tolist()
 
 
 # ── Traffic signs ─────────────────────────────────────────────────────────────
@@ -360,50 +553,104 @@ _SIGN_OFFSETS: Dict[str, Tuple[float, float]] = {
     "S": ( ROAD_HALF_W + 0.5, -ROAD_HALF_W - 0.5),
 }
 
-
-def _draw_signs(
-    screen: pygame.Surface, cam: Camera,
-    int_info: Dict[str, Any], cx: float, cy: float,
+# Unit vertex tables (cos, sin) for the sign outlines
+_HEX_UNIT: Tuple[Tuple[float, float], ...] = tuple(
+    (math.cos(math.radians(30 + i * 60)), math.sin(math.radians(30 + i * 60)))
+    for i in range(6)
+)
+_DIAMOND_UNIT: Tuple[Tuple[int, int], ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+def _sign_anchors(
+    screen: pygame.Surface, cam: Camera, net: _NetworkArrays,
+) -> Tuple[List[bool], List[Dict[str, Tuple[int, int]]]]:
+    """Per intersection: whether its signs can reach the viewport, and the
+    screen pixel of each approach's sign / semaphore post."""
+    reach = ROAD_HALF_W + 0.5
+    cx, cy = net.cx, net.cy
+    near = _world_rects(cam, cx - reach, cy - reach, cx + reach, cy + reach)
+    shown = _touches_view(screen, near, 2 * _screen_pad(cam)).tolist()
+    cols = []
+    for ox, oy in _SIGN_OFFSETS.values():
+        sx, sy = cam.world_to_screen_array(cx + ox, cy + oy)
+        cols.append(zip(sx.astype(np.int64).tolist(), sy.astype(np.int64).tolist()))
+    anchors = [dict(zip(_SIGN_OFFSETS, row)) for row in zip(*cols)]
+    return shown, anchors
+
+
+def _sign_blits(
+    cam: Camera, int_info: Dict[str, Any], spots: Dict[str, Tuple[int, int]],
+    out: List[_Blit],
 ) -> None:
     signs = int_info.get("signs", {})
     for direction, sign_name in signs.items():
-        offset = _SIGN_OFFSETS.get(direction.upper())
-        if not offset:
+        spot = spots.get(direction.upper())
+        if not spot:
             continue
-        sx, sy = cam.world_to_screen(cx + offset[0], cy + offset[1])
-        _draw_single_sign(screen, cam, int(sx), int(sy), sign_name.upper())
+        out.append(_sign_blit(cam, spot[0], spot[1], sign_name.upper()))
 
 
-def _draw_single_sign(
-    screen: pygame.Surface, cam: Camera, sx: int, sy: int, name: str,
-) -> None:
+def _sign_blit(cam: Camera, sx: int, sy: int, name: str) -> _Blit:
     s = max(5, int(3.0 * cam.zoom))
-    pole_h = int(s * 1.6)
     pw = max(1, int(cam.zoom * 0.4))
-    pygame.draw.line(screen, COLOR_SIGN_POLE, (sx, sy), (sx, sy + pole_h), pw)
+    sprite, (ox, oy) = _sign_sprite(name, s, pw, cam.zoom >= 2.5)
+    return sprite, (sx - ox, sy - oy)
+
+
+def _sign_sprite(
+    name: str, s: int, pw: int, with_text: bool,
+) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Rendered sign (pole included) and the sprite pixel at the anchor.
+
+    Keyed on the integer sizes derived from the zoom, so a cached sprite
+    matches drawing the sign in place, except for signs cut by the screen
+    edge: a clipped blit and a clipped ``pygame.draw.polygon`` round the
+    cut edge differently, and may differ by a few pixels there.
+    """
+    key = (name, s, pw, with_text)
+    hit = _sign_cache.get(key)
+    if hit is not None:
+        return hit
+
+    txt = None
+    if name == "STOP" and with_text:
+        font = _sign_font(max(8, int(s * 0.6)))
+        txt = font.render("STOP", True, COLOR_STOP_WHITE)
+    half_w = max(s, txt.get_width() // 2 + 1 if txt else 0) + pw + 2
+    pole_h = int(s * 1.6)
+    top = s + 2
+    sprite = pygame.Surface(
+        (2 * half_w, top + max(s, pole_h) + pw + 2), pygame.SRCALPHA,
+    )
+    ox, oy = half_w, top
+    pygame.draw.line(sprite, COLOR_SIGN_POLE, (ox, oy), (ox, oy + pole_h), pw)
 
     if name == "STOP":
-        _draw_hexagon(screen, sx, sy, s, COLOR_STOP_RED)
-        if cam.zoom >= 2.5:
-            font = pygame.font.SysFont("arial,helvetica", max(8, int(s * 0.6)))
-            txt = font.render("STOP", True, COLOR_STOP_WHITE)
-            screen.blit(txt, (sx - txt.get_width() // 2,
-                              sy - txt.get_height() // 2))
+        _draw_hexagon(sprite, ox, oy, s, COLOR_STOP_RED)
+        if txt is not None:
+            sprite.blit(txt, (ox - txt.get_width() // 2,
+                              oy - txt.get_height() // 2))
     elif name == "YIELD":
-        _draw_yield_triangle(screen, sx, sy, s)
+        _draw_yield_triangle(sprite, ox, oy, s)
     elif name == "PRIORITY":
-        _draw_diamond(screen, sx, sy, s,
+        _draw_diamond(sprite, ox, oy, s,
                       COLOR_PRIORITY_YELLOW, COLOR_PRIORITY_WHITE)
 
+    _sign_cache[key] = (sprite, (ox, oy))
+    return sprite, (ox, oy)
+
+
+def _sign_font(size: int) -> pygame.font.Font:
+    font = _sign_fonts.get(size)
+    if font is None:
+        font = _sign_fonts[size] = pygame.font.SysFont("arial,helvetica", size)
+    return font
+
 
 def _draw_hexagon(
     surface: pygame.Surface, cx: int, cy: int, r: int, color: Tuple[int, ...],
 ) -> None:
-    pts = []
-    for i in range(6):
-        angle = math.radians(30 + i * 60)
-        pts.append((cx + int(r * math.cos(angle)),
-                     cy - int(r * math.sin(angle))))
+    pts = [(cx + int(r * u), cy - int(r * v)) for u, v in _HEX_UNIT]
     pygame.draw.polygon(surface, color, pts)
     pygame.draw.polygon(surface, (255, 255, 255), pts, max(1, r // 5))
 
@@ -424,19 +671,15 @@ def _draw_diamond(
     surface: pygame.Surface, cx: int, cy: int, r: int,
     fill: Tuple[int, ...], border: Tuple[int, ...],
 ) -> None:
-    pts = [(cx, cy - r), (cx + r, cy), (cx, cy + r), (cx - r, cy)]
+    pts = [(cx + r * u, cy + r * v) for u, v in _DIAMOND_UNIT]
     pygame.draw.polygon(surface, fill, pts)
     pygame.draw.polygon(surface, border, pts, max(1, r // 5))
 
 
 # ── Traffic-light semaphores ──────────────────────────────────────────────────
 
-_LIGHT_OFFSETS: Dict[str, Tuple[float, float]] = {
-    "W": (-ROAD_HALF_W - 0.5, -ROAD_HALF_W - 0.5),
-    "E": ( ROAD_HALF_W + 0.5,  ROAD_HALF_W + 0.5),
-    "N": (-ROAD_HALF_W - 0.5,  ROAD_HALF_W + 0.5),
-    "S": ( ROAD_HALF_W + 0.5, -ROAD_HALF_W - 0.5),
-}
+# Semaphores stand on the same posts as signs (see _sign_anchors)
+_LIGHT_OFFSETS: Dict[str, Tuple[float, float]] = _SIGN_OFFSETS
 
 _COLOR_FOR_PHASE = {
     "GREEN":  COLOR_LIGHT_GREEN,
@@ -445,44 +688,65 @@ _COLOR_FOR_PHASE = {
 }
 
 
-def _draw_semaphores(
-    screen: pygame.Surface, cam: Camera,
-    sem: Dict[str, Any], cx: float, cy: float,
+def _semaphore_blits(
+    cam: Camera, sem: Dict[str, Any], spots: Dict[str, Tuple[int, int]],
+    out: List[_Blit],
 ) -> None:
     colors = sem.get("colors", {})
-    for approach, (wx, wy) in _LIGHT_OFFSETS.items():
+    for approach in _LIGHT_OFFSETS:
         phase = colors.get(approach, "RED")
-        sx, sy = cam.world_to_screen(cx + wx, cy + wy)
-        _draw_single_light(screen, cam, int(sx), int(sy), phase)
+        sx, sy = spots[approach]
+        out.append(_light_blit(cam, sx, sy, phase))
 
 
-def _draw_single_light(
-    screen: pygame.Surface, cam: Camera, sx: int, sy: int, phase: str,
-) -> None:
+def _light_blit(cam: Camera, sx: int, sy: int, phase: str) -> _Blit:
     bulb_r = max(2, int(1.0 * cam.zoom))
-    spacing = int(bulb_r * 2.3)
-    housing_w = bulb_r * 2 + max(1, int(cam.zoom * 0.4))
-    housing_h = spacing * 2 + bulb_r * 2 + max(1, int(cam.zoom * 0.4))
+    frame = max(1, int(cam.zoom * 0.4))
+    pw = max(1, int(cam.zoom * 0.35))
+    sprite, (ox, oy) = _light_sprite(phase, bulb_r, frame, pw)
+    return sprite, (sx - ox, sy - oy)
+
+
+def _light_sprite(
+    phase: str, bulb_r: int, frame: int, pw: int,
+) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Rendered semaphore (pole included) and the sprite pixel at the anchor."""
+    key = (phase, bulb_r, frame, pw)
+    hit = _light_cache.get(key)
+    if hit is not None:
+        return hit
 
+    spacing = int(bulb_r * 2.3)
+    housing_w = bulb_r * 2 + frame
+    housing_h = spacing * 2 + bulb_r * 2 + frame
     pole_h = int(bulb_r * 2.5)
-    pw = max(1, int(cam.zoom * 0.35))
-    pygame.draw.line(screen, COLOR_SIGN_POLE,
-                     (sx, sy + housing_h // 2),
-                     (sx, sy + housing_h // 2 + pole_h), pw)
 
-    hr = pygame.Rect(sx - housing_w // 2, sy - housing_h // 2,
+    half_w = max(housing_w // 2, pw) + 2
+    top = housing_h // 2 + 2
+    sprite = pygame.Surface(
+        (2 * half_w + 1, top + housing_h // 2 + pole_h + pw + 2), pygame.SRCALPHA,
+    )
+    ox, oy = half_w, top
+    pygame.draw.line(sprite, COLOR_SIGN_POLE,
+                     (ox, oy + housing_h // 2),
+                     (ox, oy + housing_h // 2 + pole_h), pw)
+
+    hr = pygame.Rect(ox - housing_w // 2, oy - housing_h // 2,
                      housing_w, housing_h)
-    pygame.draw.rect(screen, COLOR_LIGHT_HOUSING, hr,
+    pygame.draw.rect(sprite, COLOR_LIGHT_HOUSING, hr,
                      border_radius=max(1, bulb_r // 2))
 
     bulb_defs = [
-        ("RED",    sy - spacing),
-        ("YELLOW", sy),
-        ("GREEN",  sy + spacing),
+        ("RED",    oy - spacing),
+        ("YELLOW", oy),
+        ("GREEN",  oy + spacing),
     ]
     for bulb_phase, by in bulb_defs:
         c = _COLOR_FOR_PHASE[bulb_phase] if bulb_phase == phase else COLOR_LIGHT_OFF
-        pygame.draw.circle(screen, c, (sx, by), bulb_r)
+        pygame.draw.circle(sprite, c, (ox, by), bulb_r)
+
+    _light_cache[key] = (sprite, (ox, oy))
+    return sprite, (ox, oy)
 
 
 # ── Decorative elements ──────────────────────────────────────────────────────
@@ -495,7 +759,7 @@ def _generate_decorations(
     avoiding road corridors and other intersections."""
     hw = ROAD_HALF_W + SIDEWALK_W + 4.0  # keep away from road
     decs: List[Tuple[Any, ...]] = []
-    rng = __import__("random").Random(42)  # deterministic seed
+    rng = random.Random(42)  # deterministic seed
 
     # Build set of road corridor rectangles to avoid
     occupied: List[Tuple[float, float, float, float]] = []
@@ -503,13 +767,20 @@ def _generate_decorations(
         ccx, ccy = info["center"]
         occupied.append((ccx - 20, ccy - 20, ccx + 20, ccy + 20))
 
+    # A point is on a road when it lies in any intersection's row or
+    # column band (hw < 90, so the 90 m test is implied by the band
+    # test).  Only the nearest centre on either side can be inside the
+    # band, so a bisect over the sorted coordinates replaces the scan.
+    col_xs = sorted(info["center"][0] for info in intersections)
+    row_ys = sorted(info["center"][1] for info in intersections)
+
+    def _near(sorted_vals: List[float], v: float) -> bool:
+        k = bisect_left(sorted_vals, v)
+        return ((k < len(sorted_vals) and abs(v - sorted_vals[k]) < hw)
+                or (k > 0 and abs(v - sorted_vals[k - 1]) < hw))
+
     def _in_road(px: float, py: float) -> bool:
-        for info in intersections:
-            ccx, ccy = info["center"]
-            if abs(px - ccx) < hw or abs(py - ccy) < hw:
-                if abs(px - ccx) < 90 or abs(py - ccy) < 90:
-                    return True
-        return False
+        return _near(col_xs, px) or _near(row_ys, py)
 
     roof_colors = [COLOR_HOUSE_ROOF_A, COLOR_HOUSE_ROOF_B]
     for info in intersections:
@@ -534,8 +805,33 @@ def _generate_decorations(
 
 
 # Module-level cache so decorations are only generated once per session.
-_cached_decorations: List[Tuple[Any, ...]] = []
-_cached_dec_key: str = ""
+# Trees and houses are kept in separate homogeneous lists so the draw loop
+# never dispatches on the kind tag.
+_cached_dec_key: Tuple[Any, ...] = ()
+_cached_trees: np.ndarray = np.empty(0)         # canopy size per tree
+_cached_houses: List[Tuple[float, ...]] = []    # wx, wy, w, h, roof colour
+_cached_tree_xy: np.ndarray = np.empty((2, 0))   # world anchors, one column each
+_cached_house_xy: np.ndarray = np.empty((2, 0))
+
+
+def _anchor_array(points: List[Tuple[float, float]]) -> np.ndarray:
+    """``(2, N)`` float array of world anchors."""
+    return np.array(points, dtype=np.float64).reshape(-1, 2).T
+
+
+def _visible_anchors(
+    screen: pygame.Surface, cam: Camera, xy: np.ndarray,
+) -> Tuple[List[int], List[Tuple[int, int]]]:
+    """Indices and integer screen anchors of the on-screen columns of *xy*."""
+    sxs, sys_ = cam.world_to_screen_array(*xy)
+    w, h = screen.get_size()
+    pad = _screen_pad(cam)
+    shown = np.flatnonzero(
+        (sxs > -pad) & (sxs < w + pad) & (sys_ > -pad) & (sys_ < h + pad)
+    )
+    anchors = list(zip(sxs[shown].astype(np.int64).tolist(),
+                       sys_[shown].astype(np.int64).tolist()))
+    return shown.tolist(), anchors
 
 
 def _draw_decorations(
@@ -543,65 +839,113 @@ def _draw_decorations(
     intersections: List[Dict[str, Any]],
     roads_data: List[Dict[str, Any]],
 ) -> None:
-    global _cached_decorations, _cached_dec_key
-    key = str([(i["id"], i["center"]) for i in intersections])
+    global _cached_dec_key, _cached_trees, _cached_houses
+    global _cached_tree_xy, _cached_house_xy
+    key = tuple((i["id"], tuple(i["center"])) for i in intersections)
     if key != _cached_dec_key:
-        _cached_decorations = _generate_decorations(intersections, roads_data)
+        decs = _generate_decorations(intersections, roads_data)
+        trees = [d for d in decs if d[0] == "tree"]
+        houses = [d for d in decs if d[0] == "house"]
         _cached_dec_key = key
-    for dec in _cached_decorations:
-        kind = dec[0]
-        if kind == "tree":
-            _draw_tree(screen, cam, dec[1], dec[2], dec[3])
-        elif kind == "house":
-            _draw_house(screen, cam, dec[1], dec[2], dec[3], dec[4], dec[5])
+        _cached_trees = np.array([d[3] for d in trees], dtype=np.float64)
+        _cached_houses = [d[1:] for d in houses]
+        _cached_tree_xy = _anchor_array([(d[1], d[2]) for d in trees])
+        _cached_house_xy = _anchor_array([(d[1], d[2]) for d in houses])
+
+    # Trees first, then houses on top
+    blits: List[_Blit] = []
+    shown, anchors = _visible_anchors(screen, cam, _cached_tree_xy)
+    dims = _tree_dims(_cached_trees[shown], cam.zoom)
+    for (sx, sy), d in zip(anchors, dims):
+        sprite, (ox, oy) = _tree_sprite(*d)
+        blits.append((sprite, (sx - ox, sy - oy)))
+    shown, _ = _visible_anchors(screen, cam, _cached_house_xy)
+    for idx in shown:
+        blits.append(_house_blit(cam, *_cached_houses[idx]))
+    screen.blits(blits, doreturn=False)
+
+
+def _tree_dims(sizes: np.ndarray, zoom: float) -> List[List[int]]:
+    """``_tree_sprite`` arguments for each canopy size at *zoom*.
+
+    Computed for all visible trees at once; each column evaluates the
+    same float expression the per-tree version did, so pixel sizes match.
+    """
+    cr = np.maximum(3, (sizes * zoom).astype(np.int64))
+    tr_w = np.maximum(1, (sizes * 0.25 * zoom).astype(np.int64))
+    tr_h = np.maximum(2, (sizes * 0.5 * zoom).astype(np.int64))
+    lift_a = (sizes * 0.2 * zoom).astype(np.int64)
+    lift_b = (sizes * 0.35 * zoom).astype(np.int64)
+    return np.stack((cr, tr_w, tr_h, lift_a, lift_b), axis=1).tolist()
 
 
-def _draw_tree(
-    screen: pygame.Surface, cam: Camera, wx: float, wy: float, size: float,
-) -> None:
-    sx, sy = cam.world_to_screen(wx, wy)
-    sx, sy = int(sx), int(sy)
-    cr = max(3, int(size * cam.zoom))
-    tr_w = max(1, int(size * 0.25 * cam.zoom))
-    tr_h = max(2, int(size * 0.5 * cam.zoom))
-    draw_alpha_circle(screen, (0, 0, 0, 25), (sx + 2, sy + 2), cr)
-    pygame.draw.rect(screen, COLOR_TREE_TRUNK,
-                     (sx - tr_w // 2, sy, tr_w, tr_h))
-    pygame.draw.circle(screen, COLOR_TREE_CANOPY_A,
-                       (sx, sy - int(size * 0.2 * cam.zoom)), cr)
-    pygame.draw.circle(screen, COLOR_TREE_CANOPY_B,
-                       (sx - cr // 4, sy - int(size * 0.35 * cam.zoom)),
-                       cr // 2)
-
-
-def _draw_house(
-    screen: pygame.Surface, cam: Camera,
-    wx: float, wy: float, w: float, h: float,
+def _tree_sprite(
+    cr: int, tr_w: int, tr_h: int, lift_a: int, lift_b: int,
+) -> _Sprite:
+    """Rendered tree (shadow, trunk, two canopy discs) and its anchor pixel.
+
+    The shadow keeps its alpha in the sprite, so blitting blends it onto
+    the map exactly as :func:`~ui.helpers.draw_alpha_circle` would.
+    """
+    key = (cr, tr_w, tr_h, lift_a, lift_b)
+    hit = _tree_cache.get(key)
+    if hit is not None:
+        return hit
+
+    ox = cr + 2
+    oy = max(lift_a + cr, lift_b + cr // 2) + 2
+    sprite = pygame.Surface(
+        (2 * cr + 6, oy + max(tr_h, cr + 2) + 2), pygame.SRCALPHA,
+    )
+    # Same geometry as draw_alpha_circle: a disc clipped to its 2r box
+    shadow = pygame.Rect(ox + 2 - cr, oy + 2 - cr, 2 * cr, 2 * cr)
+    sprite.set_clip(shadow)
+    pygame.draw.circle(sprite, (0, 0, 0, 25), (ox + 2, oy + 2), cr)
+    sprite.set_clip(None)
+    pygame.draw.rect(sprite, COLOR_TREE_TRUNK,
+                     (ox - tr_w // 2, oy, tr_w, tr_h))
+    pygame.draw.circle(sprite, COLOR_TREE_CANOPY_A, (ox, oy - lift_a), cr)
+    pygame.draw.circle(sprite, COLOR_TREE_CANOPY_B,
+                       (ox - cr // 4, oy - lift_b), cr // 2)
+
+    _tree_cache[key] = (sprite, (ox, oy))
+    return sprite, (ox, oy)
+
+
+def _house_blit(
+    cam: Camera, wx: float, wy: float, w: float, h: float,
     roof_color: Tuple[int, ...],
-) -> None:
+) -> _Blit:
     rect = _world_rect(cam, wx - w / 2, wy - h / 2, wx + w / 2, wy + h / 2)
-    shadow = rect.copy()
-    shadow.move_ip(3, 3)
-    draw_alpha_rect(screen, (0, 0, 0, 30), shadow)
-    pygame.draw.rect(screen, COLOR_HOUSE_WALL, rect)
+    return _house_sprite(rect.w, rect.h, roof_color), rect.topleft
+
+
+def _house_sprite(w: int, h: int, roof_color: Tuple[int, ...]) -> pygame.Surface:
+    """Rendered house with its drop shadow, anchored at the wall's top-left."""
+    key = (w, h, roof_color)
+    sprite = _house_cache.get(key)
+    if sprite is not None:
+        return sprite
+
+    sprite = pygame.Surface((w + 3, h + 3), pygame.SRCALPHA)
+    rect = pygame.Rect(0, 0, w, h)
+    pygame.draw.rect(sprite, (0, 0, 0, 30), rect.move(3, 3))
+    pygame.draw.rect(sprite, COLOR_HOUSE_WALL, rect)
     roof_h = max(2, rect.h // 3)
     roof_rect = pygame.Rect(rect.x, rect.y, rect.w, roof_h)
-    pygame.draw.rect(screen, roof_color, roof_rect)
+    pygame.draw.rect(sprite, roof_color, roof_rect)
     dw = max(2, rect.w // 5)
     dh = max(3, rect.h // 3)
-    pygame.draw.rect(screen, COLOR_HOUSE_DOOR,
+    pygame.draw.rect(sprite, COLOR_HOUSE_DOOR,
                      (rect.centerx - dw // 2, rect.bottom - dh, dw, dh))
     win_sz = max(2, rect.w // 6)
     if rect.w > 20:
-        pygame.draw.rect(screen, COLOR_HOUSE_WINDOW,
+        pygame.draw.rect(sprite, COLOR_HOUSE_WINDOW,
                          (rect.x + rect.w // 5, rect.y + roof_h + 2,
                           win_sz, win_sz))
-        pygame.draw.rect(screen, COLOR_HOUSE_WINDOW,
+        pygame.draw.rect(sprite, COLOR_HOUSE_WINDOW,
                          (rect.right - rect.w // 5 - win_sz,
                           rect.y + roof_h + 2, win_sz, win_sz))
 
-
-# ── tiny helpers ──────────────────────────────────────────────────────────────
-
-def _i2(pair: Tuple[float, float]) -> Tuple[int, int]:
-    return int(pair[0]), int(pair[1])
+    _house_cache[key] = sprite
+    return sprite
@@ -8,12 +8,12 @@ awareness-zone indicators.  Everything is heading-aware and colour-coded.
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import pygame
 
 from ui.constants import (
-    CAR_LENGTH, CAR_WIDTH, HEADLIGHT_R, HEADLIGHT_INSET,
+    CAR_LENGTH, CAR_WIDTH, HEADLIGHT_R,
     AWARENESS_DIVISOR, COLOR_LANE_WHITE,
 )
 from ui.types import Camera
@@ -24,6 +24,18 @@ from ui.helpers import (
 )
 
 _PRETURN_BLINK_DISTANCE_M = 12.0
+_LABEL_CACHE_SIZE = 256            # rendered ID labels kept before a reset
+_CAR_CACHE_SIZE = 512              # rendered car sprites kept before a reset
+_ROUTE_CACHE_SIZE = 256            # rendered route polylines kept before a reset
+
+_label_fonts: Dict[int, pygame.font.Font] = {}
+_label_cache: Dict[Tuple[str, int], Tuple[pygame.Surface, pygame.Surface]] = {}
+# (colour, zoom, lit indicator side) → unrotated car sprite
+_car_cache: Dict[Tuple[Any, ...], pygame.Surface] = {}
+# (colour, zoom, lit indicator side, heading) → rotated car sprite
+_rotated_cache: Dict[Tuple[Any, ...], pygame.Surface] = {}
+# (RGBA, thickness, bbox-local points) → translucent route surface
+_route_cache: Dict[Tuple[Any, ...], pygame.Surface] = {}
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -38,20 +50,35 @@ def draw_all_vehicles(
     frame: int = 0,
 ) -> None:
     """Render every vehicle: route → awareness zone → car body + headlights."""
+    # Colours are resolved once and shared by all three layers
+    colors = [_get_color(v) for v in vehicles]
+
     # 1. Route lines (behind everything)
-    for v in vehicles:
-        _draw_route_line(screen, camera, v)
+    for v, color in zip(vehicles, colors):
+        _draw_route_line(screen, camera, v, color)
+
+    # Cars, rings and labels further than this off-screen draw nothing
+    pad = 2 * (int(CAR_LENGTH * camera.zoom * 3) + 32)
+    view = screen.get_rect().inflate(pad, pad)
+    on_screen = [
+        view.collidepoint(camera.world_to_screen(v["x"], v["y"]))
+        for v in vehicles
+    ]
 
-    # 2. Awareness zones
-    for v in vehicles:
+    # 2. Awareness zones (all rings pulse in phase)
+    pulse = 0.7 + 0.3 * math.sin(frame * 0.15)
+    for v, color, shown in zip(vehicles, colors, on_screen):
+        if not shown:
+            continue
         dec = decisions.get(v["id"], {})
         ml = dec.get("decision", "none")
         if should_slow_down(v, ml):
-            _draw_awareness_ring(screen, camera, v, frame)
+            _draw_awareness_ring(screen, camera, v, color, pulse)
 
     # 3. Car body + headlights (on top)
-    for v in vehicles:
-        _draw_vehicle(screen, camera, v, frame)
+    for v, color, shown in zip(vehicles, colors, on_screen):
+        if shown:
+            _draw_vehicle(screen, camera, v, color, frame)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -61,33 +88,44 @@ def draw_all_vehicles(
 # ── Route line ────────────────────────────────────────────────────────────────
 
 def _draw_route_line(
-    screen: pygame.Surface, cam: Camera, vehicle: Dict[str, Any]
+    screen: pygame.Surface, cam: Camera, vehicle: Dict[str, Any],
+    color: Tuple[int, int, int],
 ) -> None:
     """Draw the vehicle's road_line as a faded polyline in its colour."""
     road_line = vehicle.get("road_line")
     if not road_line or len(road_line) < 2:
         return
-    color = _get_color(vehicle)
     faded = (*color, 70)  # RGBA
 
-    pts = [cam.world_to_screen(p[0], p[1]) for p in road_line]
-    ipts = [(int(p[0]), int(p[1])) for p in pts]
+    # Camera.world_to_screen inlined; routes are only a handful of points,
+    # too short for NumPy to pay off
+    z = cam.zoom
+    wx, wy = cam.world_x, cam.world_y
+    cx, cy = cam.screen_w / 2, cam.screen_h / 2
+    xs = [int(cx + (p[0] - wx) * z) for p in road_line]
+    ys = [int(cy - (p[1] - wy) * z) for p in road_line]
 
-    # Draw on alpha surface
-    if len(ipts) < 2:
-        return
-    # Compute bounding box
-    xs = [p[0] for p in ipts]
-    ys = [p[1] for p in ipts]
+    # Draw on alpha surface, sized to the bounding box
     min_x, max_x = min(xs) - 4, max(xs) + 4
     min_y, max_y = min(ys) - 4, max(ys) + 4
-    w = max(1, max_x - min_x)
-    h = max(1, max_y - min_y)
-
-    tmp = pygame.Surface((w, h), pygame.SRCALPHA)
-    local_pts = [(p[0] - min_x, p[1] - min_y) for p in ipts]
+    if (max_x < 0 or max_y < 0
+            or min_x >= screen.get_width() or min_y >= screen.get_height()):
+        return
+    local_pts = tuple((x - min_x, y - min_y) for x, y in zip(xs, ys))
     thickness = max(2, int(cam.zoom * 0.8))
-    pygame.draw.lines(tmp, faded, False, local_pts, thickness)
+
+    # The surface depends only on the bbox-local polyline, so it is reused
+    # for as long as the route and zoom stay put, even while panning
+    key = (faded, thickness, local_pts)
+    tmp = _route_cache.get(key)
+    if tmp is None:
+        w = max(1, max_x - min_x)
+        h = max(1, max_y - min_y)
+        tmp = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.lines(tmp, faded, False, local_pts, thickness)
+        if len(_route_cache) >= _ROUTE_CACHE_SIZE:
+            _route_cache.clear()
+        _route_cache[key] = tmp
     screen.blit(tmp, (min_x, min_y))
 
 
@@ -95,22 +133,24 @@ def _draw_route_line(
 
 def _draw_awareness_ring(
     screen: pygame.Surface, cam: Camera,
-    vehicle: Dict[str, Any], frame: int,
+    vehicle: Dict[str, Any], color: Tuple[int, int, int], pulse: float,
 ) -> None:
-    """Pulsing coloured ring around a vehicle that should slow down."""
+    """Pulsing coloured ring around a vehicle that should slow down.
+
+    *pulse* is the frame's shared ring scale, in ``[0.4, 1.0]``.
+    """
     sx, sy = cam.world_to_screen(vehicle["x"], vehicle["y"])
-    pulse = 0.7 + 0.3 * math.sin(frame * 0.15)
     base_r = int(max(6, CAR_LENGTH * cam.zoom * 0.8))
     r = int(base_r * pulse)
     alpha = int(120 * pulse)
-    color = _get_color(vehicle)
     draw_alpha_circle(screen, (*color, alpha), (int(sx), int(sy)), r)
 
 
 # ── Vehicle body ──────────────────────────────────────────────────────────────
 
 def _draw_vehicle(
-    screen: pygame.Surface, cam: Camera, vehicle: Dict[str, Any], frame: int = 0
+    screen: pygame.Surface, cam: Camera, vehicle: Dict[str, Any],
+    color: Tuple[int, int, int], frame: int = 0,
 ) -> None:
     """
     Draw a top-down car polygon rotated by heading, with headlights.
@@ -123,14 +163,47 @@ def _draw_vehicle(
         heading = math.degrees(math.atan2(vy, vx))   # 0=East, CCW positive
     else:
         heading = direction_to_heading(vehicle.get("direction", "EAST"))
-    color = _get_color(vehicle)
     sx, sy = cam.world_to_screen(vehicle["x"], vehicle["y"])
 
-    # Pixel sizes
     cl = max(6, CAR_LENGTH * cam.zoom)
     cw = max(4, CAR_WIDTH * cam.zoom)
-    hl_r = max(1, int(HEADLIGHT_R * cam.zoom))
-    hl_off = max(1, HEADLIGHT_INSET * cam.zoom)
+
+    # Rotate & blit.  Sprites are cached on the exact heading, which
+    # only repeats for cars driving straight; turning cars miss.
+    key = (color, cam.zoom, _lit_indicator(vehicle, frame), heading)
+    rotated = _rotated_cache.get(key)
+    if rotated is None:
+        rotated = pygame.transform.rotate(_car_sprite(*key[:3]), heading)
+        if len(_rotated_cache) >= _CAR_CACHE_SIZE:
+            _rotated_cache.clear()
+        _rotated_cache[key] = rotated
+    rect = rotated.get_rect(center=(int(sx), int(sy)))
+    screen.blit(rotated, rect)
+
+    # --- Blue gyrophars for priority vehicles ---
+    if vehicle.get("priority", False):
+        _draw_gyrophars(screen, int(sx), int(sy), cl, cw, heading, frame)
+
+    # --- ID label above car ---
+    if cam.zoom >= 2.0:
+        lbl, lbl_bg = _id_label(vehicle["id"], max(9, int(cam.zoom * 3.5)))
+        screen.blit(lbl_bg, (int(sx) - lbl_bg.get_width() // 2, int(sy) - int(cw) - 14))
+        screen.blit(lbl, (int(sx) - lbl.get_width() // 2, int(sy) - int(cw) - 13))
+
+
+def _car_sprite(
+    color: Tuple[int, int, int], zoom: float, indicator: Optional[str],
+) -> pygame.Surface:
+    """Unrotated car (pointing EAST) with shadow, lights and indicator."""
+    key = (color, zoom, indicator)
+    hit = _car_cache.get(key)
+    if hit is not None:
+        return hit
+
+    # Pixel sizes
+    cl = max(6, CAR_LENGTH * zoom)
+    cw = max(4, CAR_WIDTH * zoom)
+    hl_r = max(1, int(HEADLIGHT_R * zoom))
 
     # Build car surface (pointing right = EAST)
     surf_w = int(cl + 6)
@@ -146,7 +219,7 @@ def _draw_vehicle(
     body_pts = _car_polygon(cx, cy, cl, cw)
     pygame.draw.polygon(car_surf, color, body_pts)
     # Outline
-    pygame.draw.polygon(car_surf, _darken(color, 40), body_pts, max(1, int(cam.zoom * 0.3)))
+    pygame.draw.polygon(car_surf, _darken(color, 40), body_pts, max(1, int(zoom * 0.3)))
 
     # --- Windshield (slightly darker strip near front) ---
     ws_x = cx + int(cl * 0.2)
@@ -165,25 +238,31 @@ def _draw_vehicle(
     tl_x = cx - int(cl * 0.42)
     pygame.draw.circle(car_surf, (200, 30, 30), (tl_x, hl_y_top), max(1, hl_r - 1))
     pygame.draw.circle(car_surf, (200, 30, 30), (tl_x, hl_y_bot), max(1, hl_r - 1))
-    _draw_turn_indicators(car_surf, vehicle, cx, cy, cl, cw, frame, cam.zoom)
-
-    # Rotate & blit
-    rotated = pygame.transform.rotate(car_surf, heading)
-    rect = rotated.get_rect(center=(int(sx), int(sy)))
-    screen.blit(rotated, rect)
-
-    # --- Blue gyrophars for priority vehicles ---
-    if vehicle.get("priority", False):
-        _draw_gyrophars(screen, int(sx), int(sy), cl, cw, heading, frame)
-
-    # --- ID label above car ---
-    if cam.zoom >= 2.0:
-        font = pygame.font.SysFont("arial,helvetica", max(9, int(cam.zoom * 3.5)))
-        lbl = font.render(vehicle["id"], True, (255, 255, 255))
-        lbl_bg = pygame.Surface((lbl.get_width() + 4, lbl.get_height() + 2), pygame.SRCALPHA)
-        lbl_bg.fill((0, 0, 0, 100))
-        screen.blit(lbl_bg, (int(sx) - lbl_bg.get_width() // 2, int(sy) - int(cw) - 14))
-        screen.blit(lbl, (int(sx) - lbl.get_width() // 2, int(sy) - int(cw) - 13))
+    if indicator is not None:
+        _draw_turn_indicators(car_surf, indicator, cx, cy, cl, cw, zoom)
+
+    if len(_car_cache) >= _CAR_CACHE_SIZE:
+        _car_cache.clear()
+    _car_cache[key] = car_surf
+    return car_surf
+
+
+def _id_label(text: str, size: int) -> Tuple[pygame.Surface, pygame.Surface]:
+    """Rendered ID label and its translucent backing, cached per (text, size)."""
+    key = (text, size)
+    hit = _label_cache.get(key)
+    if hit is not None:
+        return hit
+    font = _label_fonts.get(size)
+    if font is None:
+        font = _label_fonts[size] = pygame.font.SysFont("arial,helvetica", size)
+    lbl = font.render(text, True, (255, 255, 255))
+    lbl_bg = pygame.Surface((lbl.get_width() + 4, lbl.get_height() + 2), pygame.SRCALPHA)
+    lbl_bg.fill((0, 0, 0, 100))
+    if len(_label_cache) >= _LABEL_CACHE_SIZE:
+        _label_cache.clear()
+    _label_cache[key] = (lbl, lbl_bg)
+    return lbl, lbl_bg
 
 
 def _car_polygon(cx: int, cy: int, length: float, width: float) -> List[Tuple[int, int]]:
@@ -251,20 +330,14 @@ def _draw_gyrophars(
         pygame.draw.circle(screen, blue_bright, (rx, ry), light_r)
 
 
-def _draw_turn_indicators(
-    surface: pygame.Surface,
-    vehicle: Dict[str, Any],
-    cx: int,
-    cy: int,
-    car_length: float,
-    car_width: float,
-    frame: int,
-    zoom: float,
-) -> None:
-    """Blink indicator during the turn and shortly before the stop line."""
+def _lit_indicator(vehicle: Dict[str, Any], frame: int) -> Optional[str]:
+    """Side whose indicator is lit this frame (``"LEFT"``/``"RIGHT"``), or None.
+
+    Blinks during the turn and shortly before the stop line.
+    """
     intent = str(vehicle.get("turn_intent", "FORWARD")).upper()
     if intent not in ("LEFT", "RIGHT"):
-        return
+        return None
 
     dist_to_line_raw = vehicle.get("dist_to_stop_line")
     try:
@@ -275,12 +348,24 @@ def _draw_turn_indicators(
     active_turn = bool(vehicle.get("is_turning", False))
     preturn_window = 0.0 < dist_to_line <= _PRETURN_BLINK_DISTANCE_M
     if not (active_turn or preturn_window):
-        return
+        return None
 
     # Toggle roughly 5 times per second at 60 FPS.
     if (frame // 6) % 2 == 1:
-        return
+        return None
+    return intent
 
+
+def _draw_turn_indicators(
+    surface: pygame.Surface,
+    intent: str,
+    cx: int,
+    cy: int,
+    car_length: float,
+    car_width: float,
+    zoom: float,
+) -> None:
+    """Draw the lit front and rear indicator on the *intent* side."""
     front_x = cx + int(car_length * 0.42)
     rear_x = cx - int(car_length * 0.42)
     side_y = cy - int(car_width * 0.45) if intent == "LEFT" else cy + int(car_width * 0.45)
@@ -104,6 +104,20 @@ def should_slow_down(vehicle: Dict[str, Any], ml_decision: str) -> bool:
 
 # ── Alpha drawing helpers ────────────────────────────────────────────────────
 
+# Rendered translucent rectangles keyed by geometry and colour.  HUD panels
+# repeat the same few shapes every frame; blitting a kept surface skips the
+# allocate-and-draw step.  Circles are not cached: awareness rings pulse in
+# radius and alpha every frame and would only churn the cache.
+_ALPHA_CACHE_SIZE = 128
+_alpha_cache: Dict[Tuple[Any, ...], pygame.Surface] = {}
+
+
+def _remember_alpha(key: Tuple[Any, ...], surf: pygame.Surface) -> None:
+    if len(_alpha_cache) >= _ALPHA_CACHE_SIZE:
+        _alpha_cache.clear()
+    _alpha_cache[key] = surf
+
+
 def draw_alpha_rect(
     target: pygame.Surface,
     color: Tuple[int, ...],
@@ -111,8 +125,12 @@ def draw_alpha_rect(
     border_radius: int = 0,
 ) -> None:
     """Draw a semi-transparent rectangle (colour tuple with 4 channels)."""
-    tmp = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
-    pygame.draw.rect(tmp, color, (0, 0, rect.w, rect.h), border_radius=border_radius)
+    key = ("rect", rect.w, rect.h, tuple(color), border_radius)
+    tmp = _alpha_cache.get(key)
+    if tmp is None:
+        tmp = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
+        pygame.draw.rect(tmp, color, (0, 0, rect.w, rect.h), border_radius=border_radius)
+        _remember_alpha(key, tmp)
     target.blit(tmp, rect.topleft)
 
 
@@ -133,6 +151,29 @@ def draw_alpha_circle(
 
 # ── Text helper ──────────────────────────────────────────────────────────────
 
+# Rendered text keyed by font, string and colour.  Most HUD strings are
+# fixed labels or values that change a few times a second, so glyph
+# rendering is skipped on nearly every frame.
+_TEXT_CACHE_SIZE = 512
+_text_cache: Dict[Tuple[Any, ...], pygame.Surface] = {}
+
+
+def text_surface(
+    font: pygame.font.Font,
+    text: str,
+    color: Tuple[int, ...] = (230, 230, 235),
+) -> pygame.Surface:
+    """Antialiased rendering of *text*, shared between callers."""
+    key = (font, text, tuple(color))
+    img = _text_cache.get(key)
+    if img is None:
+        img = font.render(text, True, color)
+        if len(_text_cache) >= _TEXT_CACHE_SIZE:
+            _text_cache.clear()
+        _text_cache[key] = img
+    return img
+
+
 def render_text(
     surface: pygame.Surface,
     font: pygame.font.Font,
@@ -142,7 +183,7 @@ def render_text(
     anchor: str = "topleft",
 ) -> pygame.Rect:
     """Render text with flexible *anchor* ('topleft', 'center', 'midright' …)."""
-    img = font.render(text, True, color)
+    img = text_surface(font, text, color)
     rect = img.get_rect(**{anchor: pos})
     surface.blit(img, rect)
     return rect
@@ -25,7 +25,7 @@ from ui.constants import (
     BTN_W, BTN_H, LEGEND_W, TOP_BAR_H,
     FONT_SM, FONT_MD, FONT_LG,
 )
-from ui.helpers import draw_alpha_rect, render_text, should_slow_down
+from ui.helpers import draw_alpha_rect, render_text, should_slow_down, text_surface
 from ui.types import ButtonRect
 
 
@@ -44,6 +44,23 @@ def _f(key: str) -> pygame.font.Font:
     return _fonts[key]
 
 
+# Measured text widths keyed by (font key, string).  The panel layout is
+# recomputed every frame but its strings (IDs, speeds, fixed labels) repeat.
+_TEXT_W_CACHE_SIZE = 512
+_text_w_cache: Dict[Tuple[str, str], int] = {}
+
+
+def _text_w(key: str, text: str) -> int:
+    """Rendered pixel width of *text* in font *key*."""
+    w = _text_w_cache.get((key, text))
+    if w is None:
+        w = _f(key).size(text)[0]
+        if len(_text_w_cache) >= _TEXT_W_CACHE_SIZE:
+            _text_w_cache.clear()
+        _text_w_cache[(key, text)] = w
+    return w
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  TOP BAR
 # ══════════════════════════════════════════════════════════════════════════════
@@ -100,12 +117,12 @@ def draw_vehicle_panel(
     # Dynamic column layout so "● SLOW DOWN" always fits.
     id_values = [str(v.get("id", "")) for v in visible] or [""]
     speed_values = [f"{float(v.get('speed', 0.0)):.0f} km/h" for v in visible] or ["0 km/h"]
-    id_w = max(_f("sm").size(text)[0] for text in id_values)
-    speed_w = max(_f("sm").size(text)[0] for text in speed_values)
+    id_w = max(_text_w("sm", text) for text in id_values)
+    speed_w = max(_text_w("sm", text) for text in speed_values)
     slow_label = "● SLOW DOWN"
-    slow_w = _f("sm").size(slow_label)[0]
-    header_w = _f("md").size("Active Vehicles")[0]
-    more_w = _f("sm").size(f"+{hidden} more")[0] if hidden > 0 else 0
+    slow_w = _text_w("sm", slow_label)
+    header_w = _text_w("md", "Active Vehicles")
+    more_w = _text_w("sm", f"+{hidden} more") if hidden > 0 else 0
 
     swatch_x = HUD_PAD
     id_x = swatch_x + 20
@@ -128,6 +145,11 @@ def draw_vehicle_panel(
     # Header
     render_text(screen, _f("md"), "Active Vehicles", (panel_rect.x + HUD_PAD, panel_rect.y + HUD_PAD), COLOR_HUD_ACCENT)
 
+    # Rows: swatches are drawn directly; the labels (cached renders) never
+    # overlap them and go out in one batched blit
+    blink = (frame // 18) % 2 == 0  # ~0.6 s cycle at 60 fps
+    sm = _f("sm")
+    labels: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
     y = panel_rect.y + HUD_PAD + 24
     for v in visible:
         vid = v["id"]
@@ -135,34 +157,21 @@ def draw_vehicle_panel(
         color = _vehicle_display_color(v)
         dec = decisions.get(vid, {})
         ml = dec.get("decision", "none")
-        slow = should_slow_down(v, ml)
 
         # Colour swatch
         pygame.draw.rect(screen, color, (panel_rect.x + swatch_x, y + 5, 14, 14), border_radius=3)
 
-        # ID
-        render_text(screen, _f("sm"), vid, (panel_rect.x + id_x, y + 4), COLOR_HUD_TEXT)
-
-        # Speed
-        render_text(
-            screen, _f("sm"),
-            f"{speed:.0f} km/h",
-            (panel_rect.x + speed_x, y + 4),
-            COLOR_HUD_DIM,
-        )
-
-        # Blinking SLOW DOWN
-        if slow:
-            blink = (frame // 18) % 2 == 0  # ~0.6 s cycle at 60 fps
-            if blink:
-                render_text(
-                    screen, _f("sm"),
-                    slow_label,
-                    (panel_rect.x + slow_x, y + 4),
-                    COLOR_WARNING,
-                )
+        # ID, speed and the blinking SLOW DOWN
+        labels.append((text_surface(sm, vid, COLOR_HUD_TEXT),
+                       (panel_rect.x + id_x, y + 4)))
+        labels.append((text_surface(sm, f"{speed:.0f} km/h", COLOR_HUD_DIM),
+                       (panel_rect.x + speed_x, y + 4)))
+        if blink and should_slow_down(v, ml):
+            labels.append((text_surface(sm, slow_label, COLOR_WARNING),
+                           (panel_rect.x + slow_x, y + 4)))
 
         y += HUD_ROW_H
+    screen.blits(labels, doreturn=False)
 
     if hidden > 0:
         render_text(
@@ -239,8 +248,7 @@ def draw_control_bar(
         else:
             bg = COLOR_BTN_HOVER if hovered else COLOR_BTN_BG
 
-        pygame.draw.rect(screen, bg, rect, border_radius=6)
-        render_text(screen, _f("sm"), text, rect.center, COLOR_BTN_TEXT, anchor="center")
+        screen.blit(_button_sprite("sm", text, bg, BTN_W, BTN_H), rect)
         buttons.append(ButtonRect(name, bx, by, BTN_W, BTN_H))
         bx += BTN_W + 10
 
@@ -249,7 +257,7 @@ def draw_control_bar(
     step_h = BTN_H
     step_gap = 6
     vc_label = f"Vehicule: {vehicle_count}"
-    label_w = _f("sm").size(vc_label)[0]
+    label_w = _text_w("sm", vc_label)
     total_stepper_w = label_w + 10 + step_w + step_gap + step_w
     sx = sw - HUD_PAD - total_stepper_w
     sy = by
@@ -267,8 +275,7 @@ def draw_control_bar(
     ):
         hovered = rect.collidepoint(mouse_pos)
         bg = COLOR_BTN_HOVER if hovered else COLOR_BTN_BG
-        pygame.draw.rect(screen, bg, rect, border_radius=6)
-        render_text(screen, _f("md"), text, rect.center, COLOR_BTN_TEXT, anchor="center")
+        screen.blit(_button_sprite("md", text, bg, step_w, step_h), rect)
         buttons.append(ButtonRect(label, rect.x, rect.y, rect.w, rect.h))
 
     return buttons
@@ -276,6 +283,26 @@ def draw_control_bar(
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# Rendered buttons keyed by (font key, label, background, w, h).  There are
+# only a few labels × idle/hover/active colours, so the cache never grows.
+_button_cache: Dict[Tuple[Any, ...], pygame.Surface] = {}
+
+
+def _button_sprite(
+    font_key: str, text: str, bg: Tuple[int, ...], w: int, h: int,
+) -> pygame.Surface:
+    """Rounded button with its centred label; the corners stay transparent."""
+    key = (font_key, text, bg, w, h)
+    sprite = _button_cache.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((w, h), pygame.SRCALPHA)
+        rect = sprite.get_rect()
+        pygame.draw.rect(sprite, bg, rect, border_radius=6)
+        render_text(sprite, _f(font_key), text, rect.center, COLOR_BTN_TEXT, anchor="center")
+        _button_cache[key] = sprite
+    return sprite
+
+
 def _tuple_color(c: Any) -> Tuple[int, int, int]:
     if isinstance(c, (list, tuple)) and len(c) >= 3:
         return (int(c[0]), int(c[1]), int(c[2]))
@@ -401,9 +401,9 @@ def _handle_sim_key(
 ) -> None:
     """Handle zoom and pan keys (non-toggle)."""
     if key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
-        camera.zoom = min(MAX_ZOOM, camera.zoom + ZOOM_STEP)
+        camera.zoom = _step_zoom(camera.zoom, 1, min_zoom)
     elif key in (pygame.K_MINUS, pygame.K_KP_MINUS):
-        camera.zoom = max(min_zoom, camera.zoom - ZOOM_STEP)
+        camera.zoom = _step_zoom(camera.zoom, -1, min_zoom)
     elif key == pygame.K_UP:
         camera.world_y += 10.0 / camera.zoom
     elif key == pygame.K_DOWN:
@@ -444,6 +444,20 @@ def _clamp_camera(camera: Camera, bounds_x: tuple[float, float], bounds_y: tuple
         camera.world_y = max(min_cam_y, min(max_cam_y, camera.world_y))
 
 
+def _step_zoom(zoom: float, direction: int, min_zoom: float = MIN_ZOOM) -> float:
+    """One ``ZOOM_STEP`` in (*direction* > 0) or out, clamped.
+
+    Rounded so that stepping back and forth lands on the exact same
+    float instead of drifting; the zoom-keyed render caches (static map,
+    sign sprites) then hit again.
+    """
+    if direction > 0:
+        zoom = min(MAX_ZOOM, zoom + ZOOM_STEP)
+    else:
+        zoom = max(min_zoom, zoom - ZOOM_STEP)
+    return round(zoom, 6)
+
+
 def _zoom_toward(
     camera: Camera,
     mouse_pos: Tuple[int, int],
@@ -454,10 +468,7 @@ def _zoom_toward(
 ) -> None:
     """Zoom in/out centred on mouse cursor."""
     old_zoom = camera.zoom
-    if direction > 0:
-        camera.zoom = min(MAX_ZOOM, camera.zoom + ZOOM_STEP)
-    else:
-        camera.zoom = max(min_zoom, camera.zoom - ZOOM_STEP)
+    camera.zoom = _step_zoom(camera.zoom, direction, min_zoom)
     # Adjust world offset so the point under the cursor stays fixed
     mx, my = mouse_pos
     cx, cy = camera.screen_w / 2, camera.screen_h / 2
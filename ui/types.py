@@ -8,8 +8,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Any, Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Camera:
     """Viewport mapping world coordinates to screen pixels."""
     screen_w: int
@@ -25,6 +27,14 @@ class Camera:
         sy = cy - (wy - self.world_y) * self.zoom
         return sx, sy
 
+    def world_to_screen_array(
+        self, wx: np.ndarray, wy: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorised :meth:`world_to_screen` over coordinate arrays."""
+        cx = self.screen_w / 2
+        cy = self.screen_h / 2
+        return cx + (wx - self.world_x) * self.zoom, cy - (wy - self.world_y) * self.zoom
+
     def screen_to_world(self, sx: float, sy: float) -> Tuple[float, float]:
         cx = self.screen_w / 2
         cy = self.screen_h / 2
@@ -33,7 +43,7 @@ class Camera:
         return wx, wy
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleSnapshot:
     """Smoothed vehicle state for interpolation between bridge ticks."""
     x: float
@@ -43,7 +53,7 @@ class VehicleSnapshot:
     heading_deg: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ButtonRect:
     """Stores a button's screen rect and label for click detection."""
     label: str